@@ -8,12 +8,13 @@ import asyncio
 import argparse
 import sys
 import os
-from typing import List, Dict, Any
-from qdrant_client import QdrantClient
+from typing import AsyncIterator, List, Dict, Any
+from qdrant_client import models
 
 # Add src directory to path for enhanced connector access
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+from mcp_server_qdrant.clients import close_async_clients, get_async_client
 from mcp_server_qdrant.enhanced_qdrant import EnhancedQdrantConnector
 from mcp_server_qdrant.enhanced_settings import EnhancedQdrantSettings, EnhancedEmbeddingProviderSettings
 
@@ -21,12 +22,16 @@ from mcp_server_qdrant.enhanced_settings import EnhancedQdrantSettings, Enhanced
 class TestDataCleaner:
     def __init__(self, collection_name: str = "lodestar_legal_analysis"):
         self.collection_name = collection_name
-        self.client = QdrantClient(host='localhost', port=6333)
+        # Filtered deletes on large collections can exceed the default 5s timeout.
+        # gRPC avoids JSON encoding of scroll pages and multiplexes over HTTP/2.
+        self.client = get_async_client(
+            host='localhost', port=6333, grpc_port=6334, prefer_grpc=True, timeout=60
+        )
 
-    def get_collection_info(self) -> Dict[str, Any]:
+    async def get_collection_info(self) -> Dict[str, Any]:
         """Get current collection statistics"""
         try:
-            collection_info = self.client.get_collection(self.collection_name)
+            collection_info = await self.client.get_collection(self.collection_name)
             return {
                 "points_count": collection_info.points_count,
                 "status": "available"
@@ -34,6 +39,40 @@ class TestDataCleaner:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    async def _iter_matching_ids(
+        self, scroll_filter: models.Filter, batch_size: int = 1000
+    ) -> AsyncIterator[List[models.ExtendedPointId]]:
+        """
+        Yield IDs of points matching a filter one scroll page at a time
+
+        Args:
+            scroll_filter: Filter evaluated server-side by Qdrant
+            batch_size: Number of IDs fetched per scroll page
+        """
+        offset = None
+        while True:
+            points, offset = await self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=scroll_filter,
+                limit=batch_size,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False
+            )
+            if points:
+                yield [point.id for point in points]
+            if offset is None:
+                break
+
+    async def _delete_matching(self, scroll_filter: models.Filter) -> None:
+        """Delete points matching a filter in page-sized batches"""
+        async for point_ids in self._iter_matching_ids(scroll_filter):
+            await self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=point_ids,
+                wait=True
+            )
+
     async def delete_by_metadata(self, test_types: List[str]) -> Dict[str, Any]:
         """
         Delete documents by test_type metadata field
@@ -44,89 +83,54 @@ class TestDataCleaner:
         print(f"Searching for documents with test_type in: {test_types}")
         print("=" * 60)
 
-        initial_info = self.get_collection_info()
+        initial_info = await self.get_collection_info()
         initial_count = initial_info.get("points_count", 0)
         print(f"Initial collection size: {initial_count} points")
 
-        documents_to_delete = []
+        test_type_filter = models.Filter(
+            must=[
+                models.FieldCondition(
+                    key='metadata.test_type',
+                    match=models.MatchAny(any=test_types)
+                )
+            ]
+        )
 
         try:
-            # Scroll through all points
-            scroll_result = self.client.scroll(
+            # Index the field so Qdrant resolves the filter without a full scan
+            await self.client.create_payload_index(
                 collection_name=self.collection_name,
-                limit=100,
-                with_payload=True,
-                with_vectors=False
+                field_name='metadata.test_type',
+                field_schema=models.PayloadSchemaType.KEYWORD,
+                wait=True
             )
 
-            points = scroll_result[0]
-            next_offset = scroll_result[1]
-
-            # Check each point for matching metadata
-            for point in points:
-                if point.payload and 'metadata' in point.payload:
-                    metadata = point.payload.get('metadata', {})
-                    test_type = metadata.get('test_type')
-
-                    if test_type in test_types:
-                        documents_to_delete.append({
-                            'id': point.id,
-                            'test_type': test_type,
-                            'content_preview': point.payload.get('document', '')[:100] + "..."
-                        })
-                        print(f"✓ Found: ID {point.id}, Type: {test_type}")
-
-            # Continue scrolling if more pages exist
-            while next_offset:
-                scroll_result = self.client.scroll(
-                    collection_name=self.collection_name,
-                    offset=next_offset,
-                    limit=100,
-                    with_payload=True,
-                    with_vectors=False
-                )
-
-                points = scroll_result[0]
-                next_offset = scroll_result[1]
-
-                for point in points:
-                    if point.payload and 'metadata' in point.payload:
-                        metadata = point.payload.get('metadata', {})
-                        test_type = metadata.get('test_type')
-
-                        if test_type in test_types:
-                            documents_to_delete.append({
-                                'id': point.id,
-                                'test_type': test_type,
-                                'content_preview': point.payload.get('document', '')[:100] + "..."
-                            })
-                            print(f"✓ Found: ID {point.id}, Type: {test_type}")
-
+            count_result = await self.client.count(
+                collection_name=self.collection_name,
+                count_filter=test_type_filter,
+                exact=True
+            )
         except Exception as e:
-            print(f"Error during scroll: {e}")
+            print(f"Error counting matching documents: {e}")
             return {"status": "error", "error": str(e)}
 
-        print(f"\nFound {len(documents_to_delete)} test documents to delete")
-
-        if documents_to_delete:
-            point_ids = [doc['id'] for doc in documents_to_delete]
+        matched_count = count_result.count
+        print(f"\nFound {matched_count} test documents to delete")
 
+        if matched_count:
             try:
-                self.client.delete(
-                    collection_name=self.collection_name,
-                    points_selector=point_ids
-                )
+                await self._delete_matching(test_type_filter)
 
-                final_info = self.get_collection_info()
+                final_info = await self.get_collection_info()
                 final_count = final_info.get("points_count", 0)
 
-                print(f"✅ Deleted {len(point_ids)} test documents")
+                print(f"✅ Deleted {matched_count} test documents")
                 print(f"Collection size: {initial_count} → {final_count}")
                 print(f"Documents removed: {initial_count - final_count}")
 
                 return {
                     "status": "success",
-                    "deleted_count": len(point_ids),
+                    "deleted_count": matched_count,
                     "initial_count": initial_count,
                     "final_count": final_count
                 }
@@ -148,89 +152,79 @@ class TestDataCleaner:
         print(f"Searching for documents matching patterns: {patterns}")
         print("=" * 60)
 
-        initial_info = self.get_collection_info()
+        initial_info = await self.get_collection_info()
         initial_count = initial_info.get("points_count", 0)
         print(f"Initial collection size: {initial_count} points")
 
-        documents_to_delete = []
+        pattern_filter = models.Filter(
+            should=[
+                models.FieldCondition(
+                    key='document',
+                    match=models.MatchText(text=pattern)
+                )
+                for pattern in patterns
+            ]
+        )
 
         try:
-            scroll_result = self.client.scroll(
+            # The full-text index only shortlists candidates: MatchText matches
+            # every token of a pattern in any order, so each candidate is
+            # re-checked for the exact substring before it is deleted. The
+            # index is left in place for later cleanup runs.
+            await self.client.create_payload_index(
                 collection_name=self.collection_name,
-                limit=100,
-                with_payload=True,
-                with_vectors=False
+                field_name='document',
+                field_schema=models.TextIndexParams(
+                    type=models.TextIndexType.TEXT,
+                    tokenizer=models.TokenizerType.WORD,
+                    min_token_len=2,
+                    lowercase=False
+                ),
+                wait=True
             )
 
-            points = scroll_result[0]
-            next_offset = scroll_result[1]
-
-            # Check each point for pattern matches
-            for point in points:
-                if point.payload and 'document' in point.payload:
-                    content = point.payload.get('document', '')
-
-                    for pattern in patterns:
-                        if pattern in content:
-                            documents_to_delete.append({
-                                'id': point.id,
-                                'pattern': pattern,
-                                'content_preview': content[:100] + "..."
-                            })
-                            print(f"✓ Found: ID {point.id}, Pattern: {pattern}")
-                            break
-
-            # Continue scrolling
-            while next_offset:
-                scroll_result = self.client.scroll(
+            point_ids = []
+            offset = None
+            while True:
+                points, offset = await self.client.scroll(
                     collection_name=self.collection_name,
-                    offset=next_offset,
-                    limit=100,
-                    with_payload=True,
+                    scroll_filter=pattern_filter,
+                    limit=1000,
+                    offset=offset,
+                    with_payload=['document'],
                     with_vectors=False
                 )
-
-                points = scroll_result[0]
-                next_offset = scroll_result[1]
-
                 for point in points:
-                    if point.payload and 'document' in point.payload:
-                        content = point.payload.get('document', '')
-
-                        for pattern in patterns:
-                            if pattern in content:
-                                documents_to_delete.append({
-                                    'id': point.id,
-                                    'pattern': pattern,
-                                    'content_preview': content[:100] + "..."
-                                })
-                                print(f"✓ Found: ID {point.id}, Pattern: {pattern}")
-                                break
-
+                    content = (point.payload or {}).get('document', '')
+                    if any(pattern in content for pattern in patterns):
+                        point_ids.append(point.id)
+                if offset is None:
+                    break
         except Exception as e:
             print(f"Error during scroll: {e}")
             return {"status": "error", "error": str(e)}
 
-        print(f"\nFound {len(documents_to_delete)} test documents to delete")
-
-        if documents_to_delete:
-            point_ids = [doc['id'] for doc in documents_to_delete]
+        matched_count = len(point_ids)
+        print(f"\nFound {matched_count} test documents to delete")
 
+        if point_ids:
             try:
-                self.client.delete(
-                    collection_name=self.collection_name,
-                    points_selector=point_ids
-                )
-
-                final_info = self.get_collection_info()
+                for start in range(0, len(point_ids), 1000):
+                    await self.client.delete(
+                        collection_name=self.collection_name,
+                        points_selector=point_ids[start:start + 1000],
+                        wait=True
+                    )
+
+                final_info = await self.get_collection_info()
                 final_count = final_info.get("points_count", 0)
 
-                print(f"✅ Deleted {len(point_ids)} test documents")
+                print(f"✅ Deleted {matched_count} test documents")
                 print(f"Collection size: {initial_count} → {final_count}")
 
                 return {
                     "status": "success",
-                    "deleted_count": len(point_ids),
+                    "deleted_count": matched_count,
                     "initial_count": initial_count,
                     "final_count": final_count
                 }
@@ -277,10 +271,13 @@ async def main():
 
     cleaner = TestDataCleaner(collection_name=args.collection)
 
-    if args.mode == "metadata":
-        result = await cleaner.delete_by_metadata(args.test_types)
-    else:
-        result = await cleaner.delete_by_content_patterns(args.patterns)
+    try:
+        if args.mode == "metadata":
+            result = await cleaner.delete_by_metadata(args.test_types)
+        else:
+            result = await cleaner.delete_by_content_patterns(args.patterns)
+    finally:
+        await close_async_clients()
 
     print("\n" + "=" * 60)
     print(f"Cleanup Result: {result.get('status', 'unknown')}")
@@ -9,28 +9,39 @@ import argparse
 import sys
 import os
 import json
-from typing import Dict, Any, Optional
-from qdrant_client import QdrantClient
+from typing import Dict, Any, List, Optional
+from qdrant_client import models
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+from mcp_server_qdrant.clients import close_async_clients, get_async_client
 from mcp_server_qdrant.enhanced_qdrant import EnhancedQdrantConnector
 from mcp_server_qdrant.enhanced_settings import EnhancedQdrantSettings, EnhancedEmbeddingProviderSettings
 
 
 class CollectionInspector:
     def __init__(self):
-        self.client = QdrantClient(host='localhost', port=6333)
-
-    def list_all_collections(self) -> None:
+        # gRPC avoids JSON encoding of scroll pages and multiplexes over HTTP/2
+        self.client = get_async_client(
+            host='localhost', port=6333, grpc_port=6334, prefer_grpc=True
+        )
+
+    async def _get_collection_infos(self, collections: List[Any]) -> List[Any]:
+        """Fetch info for all collections concurrently, returning exceptions in place"""
+        return await asyncio.gather(
+            *(self.client.get_collection(collection.name) for collection in collections),
+            return_exceptions=True
+        )
+
+    async def list_all_collections(self) -> None:
         """List all available collections with statistics"""
         print("=" * 80)
         print("QDRANT COLLECTIONS")
         print("=" * 80)
 
         try:
-            collections = self.client.get_collections()
+            collections = await self.client.get_collections()
 
             if not collections.collections:
                 print("No collections found")
@@ -39,9 +50,12 @@ class CollectionInspector:
             largest_collection = None
             max_points = 0
 
-            for collection in collections.collections:
+            collection_infos = await self._get_collection_infos(collections.collections)
+
+            for collection, collection_info in zip(collections.collections, collection_infos):
                 try:
-                    collection_info = self.client.get_collection(collection.name)
+                    if isinstance(collection_info, Exception):
+                        raise collection_info
                     points_count = collection_info.points_count
 
                     # Track largest collection
@@ -73,7 +87,7 @@ class CollectionInspector:
         except Exception as e:
             print(f"Error listing collections: {e}")
 
-    def inspect_collection(self, collection_name: str, limit: int = 10) -> None:
+    async def inspect_collection(self, collection_name: str, limit: int = 10) -> None:
         """
         Inspect a specific collection and show recent points
 
@@ -87,7 +101,7 @@ class CollectionInspector:
 
         try:
             # Get collection info
-            collection_info = self.client.get_collection(collection_name)
+            collection_info = await self.client.get_collection(collection_name)
             points_count = collection_info.points_count
 
             print(f"\n📊 Collection Statistics:")
@@ -105,10 +119,13 @@ class CollectionInspector:
             print(f"\n📄 Sample Points (showing up to {limit}):")
             print("-" * 80)
 
-            scroll_result = self.client.scroll(
+            # Only the fields displayed below are fetched
+            scroll_result = await self.client.scroll(
                 collection_name=collection_name,
                 limit=limit,
-                with_payload=True,
+                with_payload=models.PayloadSelectorInclude(
+                    include=['document', 'metadata']
+                ),
                 with_vectors=False
             )
 
@@ -118,50 +135,56 @@ class CollectionInspector:
                 print("   No points found in collection")
                 return
 
+            # Pretty-print metadata only for interactive output
+            indent = 6 if sys.stdout.isatty() else None
+            lines = []
+
             for idx, point in enumerate(points, 1):
-                print(f"\n   Point {idx}:")
-                print(f"   ID: {point.id}")
+                lines.append(f"\n   Point {idx}:")
+                lines.append(f"   ID: {point.id}")
 
                 if point.payload:
                     # Show document content preview
                     if 'document' in point.payload:
                         content = point.payload['document']
-                        print(f"   Content: {content[:150]}...")
+                        lines.append(f"   Content: {content[:150]}...")
 
                     # Show metadata if present
                     if 'metadata' in point.payload:
                         metadata = point.payload['metadata']
-                        print(f"   Metadata: {json.dumps(metadata, indent=6)}")
+                        lines.append(f"   Metadata: {json.dumps(metadata, indent=indent)}")
 
-                print("-" * 80)
+                lines.append("-" * 80)
+
+            print("\n".join(lines))
 
         except Exception as e:
             print(f"❌ Error inspecting collection '{collection_name}': {e}")
 
-    def find_largest_collection(self) -> Optional[Dict[str, Any]]:
+    async def find_largest_collection(self) -> Optional[Dict[str, Any]]:
         """Find and return information about the largest collection"""
         try:
-            collections = self.client.get_collections()
+            collections = await self.client.get_collections()
 
             largest = None
             max_points = 0
 
-            for collection in collections.collections:
-                try:
-                    collection_info = self.client.get_collection(collection.name)
-                    points_count = collection_info.points_count
-
-                    if points_count > max_points:
-                        max_points = points_count
-                        largest = {
-                            "name": collection.name,
-                            "points_count": points_count,
-                            "status": collection_info.status
-                        }
+            collection_infos = await self._get_collection_infos(collections.collections)
 
-                except Exception:
+            for collection, collection_info in zip(collections.collections, collection_infos):
+                if isinstance(collection_info, Exception):
                     continue
 
+                points_count = collection_info.points_count
+
+                if points_count > max_points:
+                    max_points = points_count
+                    largest = {
+                        "name": collection.name,
+                        "points_count": points_count,
+                        "status": collection_info.status
+                    }
+
             return largest
 
         except Exception as e:
@@ -194,27 +217,30 @@ async def main():
 
     inspector = CollectionInspector()
 
-    if args.mode == "list":
-        inspector.list_all_collections()
-
-    elif args.mode == "inspect":
-        if not args.collection:
-            print("Error: --collection is required for inspect mode")
-            parser.print_help()
-            return
-
-        inspector.inspect_collection(args.collection, args.limit)
-
-    elif args.mode == "largest":
-        largest = inspector.find_largest_collection()
-        if largest:
-            print("=" * 80)
-            print(f"🏆 Largest Collection: {largest['name']}")
-            print(f"   Points: {largest['points_count']:,}")
-            print(f"   Status: {largest['status']}")
-            print("=" * 80)
-        else:
-            print("No collections found")
+    try:
+        if args.mode == "list":
+            await inspector.list_all_collections()
+
+        elif args.mode == "inspect":
+            if not args.collection:
+                print("Error: --collection is required for inspect mode")
+                parser.print_help()
+                return
+
+            await inspector.inspect_collection(args.collection, args.limit)
+
+        elif args.mode == "largest":
+            largest = await inspector.find_largest_collection()
+            if largest:
+                print("=" * 80)
+                print(f"🏆 Largest Collection: {largest['name']}")
+                print(f"   Points: {largest['points_count']:,}")
+                print(f"   Status: {largest['status']}")
+                print("=" * 80)
+            else:
+                print("No collections found")
+    finally:
+        await close_async_clients()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+"""
+Shared Qdrant clients so every component talking to the same server reuses one connection pool.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from qdrant_client import AsyncQdrantClient
+
+# gRPC channel options: ping idle connections so they aren't dropped and re-dialed
+GRPC_CHANNEL_OPTIONS = {"grpc.keepalive_time_ms": 30000}
+
+_async_clients: Dict[Tuple[Any, ...], AsyncQdrantClient] = {}
+
+
+def get_async_client(
+    location: Optional[str] = None,
+    api_key: Optional[str] = None,
+    path: Optional[str] = None,
+    host: Optional[str] = None,
+    port: int = 6333,
+    grpc_port: int = 6334,
+    prefer_grpc: bool = False,
+    timeout: Optional[int] = None,
+) -> AsyncQdrantClient:
+    """
+    Get the process-wide AsyncQdrantClient for a connection configuration.
+
+    Clients are created on first use and reused for identical arguments.
+
+    :param location: Qdrant URL or ":memory:".
+    :param api_key: API key for the Qdrant server.
+    :param path: Storage directory for local mode.
+    :param host: Qdrant host name, used when no location is given.
+    :param port: REST port.
+    :param grpc_port: gRPC port.
+    :param prefer_grpc: Whether to use gRPC for operations that support it.
+    :param timeout: Request timeout in seconds.
+    :return: The shared client.
+    """
+    key = (location, api_key, path, host, port, grpc_port, prefer_grpc, timeout)
+    client = _async_clients.get(key)
+    if client is None:
+        client = AsyncQdrantClient(
+            location=location,
+            api_key=api_key,
+            path=path,
+            host=host,
+            port=port,
+            grpc_port=grpc_port,
+            prefer_grpc=prefer_grpc,
+            timeout=timeout,
+            grpc_options=GRPC_CHANNEL_OPTIONS if prefer_grpc else None,
+        )
+        _async_clients[key] = client
+    return client
+
+
+async def close_async_clients() -> None:
+    """Close and forget every shared client."""
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.close()
@@ -3,13 +3,53 @@ Enhanced FastEmbed provider that supports collection-specific models and dimensi
 """
 
 import asyncio
+import hashlib
+import logging
 import os
-import sys
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import numpy as np
 from fastembed import TextEmbedding
 from fastembed.common.model_description import DenseModelDescription
 from mcp_server_qdrant.embeddings.base import EmbeddingProvider
 
+logger = logging.getLogger(__name__)
+
+# Micro-batching limits for coalescing concurrent embed_documents calls
+EMBED_BATCH_MAX = 64
+EMBED_BATCH_MAX_CUDA = 256  # Larger batches keep the GPU saturated
+EMBED_BATCH_WINDOW_SECONDS = 0.005
+
+# Number of query embeddings kept in the LRU cache
+QUERY_CACHE_MAX_SIZE = 1024
+
+# Number of document embeddings kept in the LRU cache
+DOCUMENT_CACHE_MAX_SIZE = 4096
+
+PendingEmbedding = Tuple[List[str], "asyncio.Future[np.ndarray]"]
+
+
+def _passage_embed_sync(
+    model: TextEmbedding, documents: List[str], batch_size: int
+) -> np.ndarray:
+    """Embed passages into a float32 matrix. Runs on the inference executor."""
+    # Embed longest first so each batch is padded to similar lengths, then
+    # restore the caller's order
+    order = sorted(range(len(documents)), key=lambda i: len(documents[i]), reverse=True)
+    sorted_embeddings = np.asarray(
+        list(model.passage_embed([documents[i] for i in order], batch_size=batch_size)),
+        dtype=np.float32,
+    )
+    embeddings = np.empty_like(sorted_embeddings)
+    embeddings[order] = sorted_embeddings
+    return embeddings
+
+
+def _query_embed_sync(model: TextEmbedding, query: str) -> np.ndarray:
+    """Embed a single query into a float32 vector. Runs on the inference executor."""
+    return np.asarray(next(iter(model.query_embed([query]))), dtype=np.float32)
+
 
 class EnhancedFastEmbedProvider(EmbeddingProvider):
     """
@@ -21,8 +61,6 @@ class EnhancedFastEmbedProvider(EmbeddingProvider):
         embedding_settings,
         default_model: str = "sentence-transformers/all-MiniLM-L6-v2",
     ):
-        # print(f"[DEBUG] enhanced_fastembed.py: EnhancedFastEmbedProvider.__init__ called", file=sys.stderr)
-
         self.embedding_settings = embedding_settings
         self.default_model = default_model
         self._model_cache: Dict[str, TextEmbedding] = {}
@@ -31,20 +69,99 @@ class EnhancedFastEmbedProvider(EmbeddingProvider):
         # Check for CUDA support
         self.use_cuda = os.getenv("FASTEMBED_CUDA", "false").lower() == "true"
 
+        # Dedicated executor for FastEmbed inference: a single worker serializes
+        # GPU access, while CPU inference splits the cores between workers so
+        # ONNX intra-op threads don't oversubscribe the machine.
+        cpu_count = os.cpu_count() or 2
+        executor_workers = 1 if self.use_cuda else min(4, cpu_count)
+        self._onnx_threads = max(1, cpu_count // executor_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=executor_workers, thread_name_prefix="fastembed"
+        )
+
+        # Per-model queues feeding the embed_documents micro-batcher
+        self._batch_max = EMBED_BATCH_MAX_CUDA if self.use_cuda else EMBED_BATCH_MAX
+        self._embed_queues: Dict[str, "asyncio.Queue[PendingEmbedding]"] = {}
+        self._embed_workers: Dict[str, asyncio.Task] = {}
+
+        # LRU cache of query embeddings keyed by (fastembed model, query).
+        # Stored as float32 arrays: ~4 bytes per dimension instead of a PyFloat.
+        self._query_cache: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+
+        # LRU cache of document embeddings keyed by (fastembed model, content digest),
+        # so re-stored or re-indexed content skips the encoder
+        self._document_cache: "OrderedDict[Tuple[str, bytes], np.ndarray]" = (
+            OrderedDict()
+        )
+        self._document_cache_hits = 0
+        self._document_cache_misses = 0
+
+        self._warmed_up = False
+
+        # Per-collection model and vector settings; the mappings are fixed at startup
+        self._model_name_cache: Dict[str, str] = {}
+        self._vector_name_cache: Dict[str, str] = {}
+        self._vector_size_cache: Dict[str, int] = {}
+        self._model_info_cache: Dict[str, Dict[str, Any]] = {}
+
         # Initialize default model with GPU support if available
         try:
-            # print(f"[DEBUG] enhanced_fastembed.py: Creating default TextEmbedding with model={default_model}, cuda={self.use_cuda}", file=sys.stderr)
             self._model_cache[default_model] = self._create_text_embedding(
                 default_model
             )
-            # print(f"[DEBUG] enhanced_fastembed.py: Default TextEmbedding created successfully", file=sys.stderr)
         except Exception:
-            # print(f"[ERROR] enhanced_fastembed.py: Failed to create default TextEmbedding: {type(e).__name__}: {e}", file=sys.stderr)
-            import traceback
-
-            traceback.print_exc(file=sys.stderr)
+            logger.exception("Failed to create default TextEmbedding %s", default_model)
             raise
 
+    async def warm_up(self) -> None:
+        """
+        Load every configured model and run a throwaway query through each.
+
+        Moves ONNX session creation and first-inference allocations to startup
+        instead of the first request for each collection. Models are loaded
+        concurrently on the inference executor; failures are logged and the
+        model is left to lazy loading.
+        """
+        if self._warmed_up:
+            return
+
+        loop = asyncio.get_running_loop()
+        model_names = [
+            model_name
+            for model_name in self.embedding_settings.list_all_fastembed_models()
+            if model_name not in self._model_cache
+        ]
+        loaded_models = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._executor, self._create_text_embedding, model_name
+                )
+                for model_name in model_names
+            ),
+            return_exceptions=True,
+        )
+        for model_name, model in zip(model_names, loaded_models):
+            if isinstance(model, BaseException):
+                logger.warning("Failed to preload model %s: %s", model_name, model)
+                continue
+            self._model_cache.setdefault(model_name, model)
+
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, self._run_warmup_query, model)
+                for model in list(self._model_cache.values())
+            ),
+            return_exceptions=True,
+        )
+        self._warmed_up = True
+
+    @staticmethod
+    def _run_warmup_query(model: TextEmbedding) -> None:
+        """Run a throwaway inference so first-call allocations happen up front."""
+        list(model.query_embed(["warmup"]))
+
     def set_collection_context(self, collection_name: str):
         """Set the current collection context for model selection."""
         self._current_collection = collection_name
@@ -59,13 +176,22 @@ class EnhancedFastEmbedProvider(EmbeddingProvider):
                     providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
                 )
             except Exception as e:
-                print(
-                    f"[WARNING] CUDA initialization failed for {model_name}, falling back to CPU: {e}",
-                    file=sys.stderr,
+                logger.warning(
+                    "CUDA initialization failed for %s, falling back to CPU: %s",
+                    model_name,
+                    e,
+                )
+                return TextEmbedding(
+                    model_name,
+                    providers=["CPUExecutionProvider"],
+                    threads=self._onnx_threads,
                 )
-                return TextEmbedding(model_name, providers=["CPUExecutionProvider"])
         else:
-            return TextEmbedding(model_name, providers=["CPUExecutionProvider"])
+            return TextEmbedding(
+                model_name,
+                providers=["CPUExecutionProvider"],
+                threads=self._onnx_threads,
+            )
 
     def _get_model_for_collection(
         self, collection_name: Optional[str] = None
@@ -78,63 +204,259 @@ class EnhancedFastEmbedProvider(EmbeddingProvider):
             return self._model_cache[self.default_model]
 
         # Get model name for this collection
-        fastembed_model = self.embedding_settings.get_fastembed_model_for_collection(
-            collection_name
-        )
-
-        # Check if we already have this model cached
-        if fastembed_model not in self._model_cache:
-            try:
-                print(
-                    f"[DEBUG] enhanced_fastembed.py: Loading new model {fastembed_model} for collection {collection_name}",
-                    file=sys.stderr,
+        fastembed_model = self._model_name_cache.get(collection_name)
+        if fastembed_model is None:
+            fastembed_model = (
+                self.embedding_settings.get_fastembed_model_for_collection(
+                    collection_name
                 )
-                self._model_cache[fastembed_model] = self._create_text_embedding(
-                    fastembed_model
-                )
-                print(
-                    f"[DEBUG] enhanced_fastembed.py: Model {fastembed_model} loaded successfully",
-                    file=sys.stderr,
-                )
-            except Exception as e:
-                print(
-                    f"[ERROR] enhanced_fastembed.py: Failed to load model {fastembed_model} for collection {collection_name}: {e}",
-                    file=sys.stderr,
-                )
-                print(
-                    f"[ERROR] enhanced_fastembed.py: This will cause vector name mismatch! Expected: {self.embedding_settings.get_vector_name_for_collection(collection_name)}, but using default model vector name",
-                    file=sys.stderr,
-                )
-                # Fall back to default model but log the issue
-                return self._model_cache[self.default_model]
+            )
+            self._model_name_cache[collection_name] = fastembed_model
 
-        return self._model_cache[fastembed_model]
+        model = self._model_cache.get(fastembed_model)
+        if model is not None:
+            return model
+
+        # Load the model on first use
+        try:
+            logger.debug(
+                "Loading new model %s for collection %s",
+                fastembed_model,
+                collection_name,
+            )
+            model = self._create_text_embedding(fastembed_model)
+            logger.debug("Model %s loaded successfully", fastembed_model)
+        except Exception as e:
+            logger.error(
+                "Failed to load model %s for collection %s: %s",
+                fastembed_model,
+                collection_name,
+                e,
+            )
+            logger.error(
+                "This will cause vector name mismatch! Expected: %s, but using default model vector name",
+                self.embedding_settings.get_vector_name_for_collection(collection_name),
+            )
+            # Fall back to default model but log the issue
+            return self._model_cache[self.default_model]
+
+        self._model_cache[fastembed_model] = model
+        return model
 
     async def embed_documents(
         self, documents: List[str], collection_name: Optional[str] = None
     ) -> List[List[float]]:
-        """Embed a list of documents into vectors."""
+        """
+        Embed a list of documents into vectors.
+
+        Concurrent calls for the same model are coalesced into a single
+        passage_embed invocation by a background batching worker.
+        """
+        if not documents:
+            return []
+
         model = self._get_model_for_collection(collection_name)
+        keys = [self._document_key(model, document) for document in documents]
+        rows = [self._get_cached_document(key) for key in keys]
+        missing = [i for i, row in enumerate(rows) if row is None]
 
-        # Run in a thread pool since FastEmbed is synchronous
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None, lambda: list(model.passage_embed(documents))
-        )
-        return [embedding.tolist() for embedding in embeddings]
+        if missing:
+            future = asyncio.get_running_loop().create_future()
+            self._get_embed_queue(model).put_nowait(
+                ([documents[i] for i in missing], future)
+            )
+            for i, row in zip(missing, await future):
+                rows[i] = row
+                self._cache_document(keys[i], row)
+
+        # One 2-D conversion per caller instead of one per vector
+        return np.stack(rows).tolist()
+
+    async def aiter_embed_documents(
+        self, documents: List[str], collection_name: Optional[str] = None
+    ) -> AsyncIterator[List[float]]:
+        """
+        Embed documents, yielding each vector as soon as it is produced.
+
+        Unlike embed_documents, the full batch is never materialized, so callers
+        can start ingesting vectors while the rest are still being computed.
+        """
+        if not documents:
+            return
+
+        model = self._get_model_for_collection(collection_name)
+        keys = [self._document_key(model, document) for document in documents]
+        rows = [self._get_cached_document(key) for key in keys]
+        missing = [document for document, row in zip(documents, rows) if row is None]
+
+        if not missing:
+            for row in rows:
+                yield row.tolist()
+            return
+
+        loop = asyncio.get_running_loop()
+        batch_size = self._batch_max
+        slices = [
+            missing[start : start + batch_size]
+            for start in range(0, len(missing), batch_size)
+        ]
+
+        def embed_slice(index: int) -> "Optional[asyncio.Future[np.ndarray]]":
+            if index >= len(slices):
+                return None
+            return loop.run_in_executor(
+                self._executor, _passage_embed_sync, model, slices[index], batch_size
+            )
+
+        # One executor call per slice frees the inference thread between slices,
+        # so queries are not held up for a whole ingest. The next slice is embedded
+        # while the caller consumes this one, and no further until it asks for more.
+        next_slice = embed_slice(0)
+        slice_index = 0
+        embedded: List[np.ndarray] = []
+        position = 0
+        try:
+            # Cached rows are yielded in place; the rest come from the slices in order
+            for key, row in zip(keys, rows):
+                if row is None:
+                    if position == len(embedded):
+                        embedded = list(await next_slice)
+                        position = 0
+                        slice_index += 1
+                        next_slice = embed_slice(slice_index)
+                    row = embedded[position]
+                    position += 1
+                    self._cache_document(key, row)
+                yield row.tolist()
+        finally:
+            if next_slice is not None:
+                # Stopped early or failed; drop the prefetched slice
+                next_slice.cancel()
+
+    def _get_embed_queue(
+        self, model: TextEmbedding
+    ) -> "asyncio.Queue[PendingEmbedding]":
+        """Get the batching queue for a model, starting its worker if needed."""
+        loop = asyncio.get_running_loop()
+        worker = self._embed_workers.get(model.model_name)
+
+        # Queues are bound to the loop that created them; rebuild on a new loop
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            queue: "asyncio.Queue[PendingEmbedding]" = asyncio.Queue()
+            self._embed_queues[model.model_name] = queue
+            self._embed_workers[model.model_name] = loop.create_task(
+                self._run_embed_worker(model, queue)
+            )
+
+        return self._embed_queues[model.model_name]
+
+    async def _run_embed_worker(
+        self, model: TextEmbedding, queue: "asyncio.Queue[PendingEmbedding]"
+    ) -> None:
+        """Drain queued requests in batches and resolve their futures."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            pending = [await queue.get()]
+            document_count = len(pending[0][0])
+
+            # Gather more requests until the batch is full or the window closes
+            while document_count < self._batch_max:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), timeout=EMBED_BATCH_WINDOW_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                document_count += len(item[0])
+
+            batch = [document for documents, _ in pending for document in documents]
+
+            try:
+                # Run in a thread pool since FastEmbed is synchronous
+                embeddings = await loop.run_in_executor(
+                    self._executor, _passage_embed_sync, model, batch, self._batch_max
+                )
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for documents, future in pending:
+                chunk = embeddings[offset : offset + len(documents)]
+                offset += len(documents)
+                if not future.done():
+                    future.set_result(chunk)
 
     async def embed_query(
         self, query: str, collection_name: Optional[str] = None
     ) -> List[float]:
-        """Embed a query into a vector."""
+        """Embed a query into a vector, reusing cached embeddings for repeat queries."""
         model = self._get_model_for_collection(collection_name)
 
+        cache_key = (model.model_name, query)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            self._query_cache.move_to_end(cache_key)
+            self._query_cache_hits += 1
+            return cached.tolist()
+
+        self._query_cache_misses += 1
+
         # Run in a thread pool since FastEmbed is synchronous
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None, lambda: list(model.query_embed([query]))
+        loop = asyncio.get_running_loop()
+        embedding = await loop.run_in_executor(
+            self._executor, _query_embed_sync, model, query
         )
-        return embeddings[0].tolist()
+
+        self._query_cache[cache_key] = embedding
+        if len(self._query_cache) > QUERY_CACHE_MAX_SIZE:
+            self._query_cache.popitem(last=False)
+
+        return embedding.tolist()
+
+    @staticmethod
+    def _document_key(model: TextEmbedding, document: str) -> Tuple[str, bytes]:
+        """Key a document by model and content digest rather than the full text."""
+        return (model.model_name, hashlib.sha256(document.encode()).digest())
+
+    def _get_cached_document(self, key: Tuple[str, bytes]) -> Optional[np.ndarray]:
+        """Look up a document embedding, counting the hit or miss."""
+        row = self._document_cache.get(key)
+        if row is None:
+            self._document_cache_misses += 1
+            return None
+        self._document_cache.move_to_end(key)
+        self._document_cache_hits += 1
+        return row
+
+    def _cache_document(self, key: Tuple[str, bytes], row: np.ndarray) -> None:
+        """Cache a document embedding, evicting the least recently used one if full."""
+        # Copy so the cache doesn't keep the whole batch matrix alive
+        self._document_cache[key] = np.array(row, dtype=np.float32)
+        if len(self._document_cache) > DOCUMENT_CACHE_MAX_SIZE:
+            self._document_cache.popitem(last=False)
+
+    def get_document_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for the document embedding cache."""
+        return {
+            "size": len(self._document_cache),
+            "max_size": DOCUMENT_CACHE_MAX_SIZE,
+            "hits": self._document_cache_hits,
+            "misses": self._document_cache_misses,
+        }
+
+    def get_query_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for the query embedding cache."""
+        return {
+            "size": len(self._query_cache),
+            "max_size": QUERY_CACHE_MAX_SIZE,
+            "hits": self._query_cache_hits,
+            "misses": self._query_cache_misses,
+        }
 
     def get_vector_name(self, collection_name: Optional[str] = None) -> str:
         """
@@ -142,11 +464,15 @@ class EnhancedFastEmbedProvider(EmbeddingProvider):
         """
         collection_name = collection_name or self._current_collection
         if collection_name:
+            cached_vector_name = self._vector_name_cache.get(collection_name)
+            if cached_vector_name is not None:
+                return cached_vector_name
+
             expected_vector_name = (
                 self.embedding_settings.get_vector_name_for_collection(collection_name)
             )
 
-            # Verify that the model we'll use matches the expected vector name
+            # Verify once per collection that the model matches the expected vector name
             try:
                 model = self._get_model_for_collection(collection_name)
                 actual_fastembed_model = (
@@ -157,17 +483,18 @@ class EnhancedFastEmbedProvider(EmbeddingProvider):
 
                 # Check if the model in cache matches what we expect
                 if actual_fastembed_model not in self._model_cache:
-                    print(
-                        f"[WARNING] enhanced_fastembed.py: Expected model {actual_fastembed_model} not in cache for collection {collection_name}",
-                        file=sys.stderr,
+                    logger.warning(
+                        "Expected model %s not in cache for collection %s",
+                        actual_fastembed_model,
+                        collection_name,
                     )
 
             except Exception as e:
-                print(
-                    f"[WARNING] enhanced_fastembed.py: Error verifying model for collection {collection_name}: {e}",
-                    file=sys.stderr,
+                logger.warning(
+                    "Error verifying model for collection %s: %s", collection_name, e
                 )
 
+            self._vector_name_cache[collection_name] = expected_vector_name
             return expected_vector_name
 
         # Default behavior for backward compatibility
@@ -179,9 +506,13 @@ class EnhancedFastEmbedProvider(EmbeddingProvider):
         """Get the size of the vector for the Qdrant collection."""
         collection_name = collection_name or self._current_collection
         if collection_name:
-            return self.embedding_settings.get_dimensions_for_collection(
-                collection_name
-            )
+            vector_size = self._vector_size_cache.get(collection_name)
+            if vector_size is None:
+                vector_size = self.embedding_settings.get_dimensions_for_collection(
+                    collection_name
+                )
+                self._vector_size_cache[collection_name] = vector_size
+            return vector_size
 
         # Default behavior for backward compatibility
         model = self._get_model_for_collection(collection_name)
@@ -195,13 +526,18 @@ class EnhancedFastEmbedProvider(EmbeddingProvider):
 
     def get_model_info_for_collection(self, collection_name: str) -> Dict[str, any]:
         """Get comprehensive model information for a collection."""
-        config = self.embedding_settings.get_model_config_for_collection(
-            collection_name
-        )
-        return {
-            "collection_name": collection_name,
-            "vector_name": config.get("vector_name"),
-            "dimensions": config.get("dimensions"),
-            "fastembed_model": config.get("fastembed_model"),
-            "provider": config.get("provider"),
-        }
+        info = self._model_info_cache.get(collection_name)
+        if info is None:
+            config = self.embedding_settings.get_model_config_for_collection(
+                collection_name
+            )
+            info = {
+                "collection_name": collection_name,
+                "vector_name": config.vector_name,
+                "dimensions": config.dimensions,
+                "fastembed_model": config.fastembed_model,
+                "provider": config.provider,
+            }
+            self._model_info_cache[collection_name] = info
+        # Callers embed this in their own responses, so hand out a copy
+        return dict(info)
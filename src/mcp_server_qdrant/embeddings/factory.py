@@ -9,19 +9,9 @@ def create_embedding_provider(settings: EmbeddingProviderSettings) -> EmbeddingP
     :param settings: The settings for the embedding provider.
     :return: An instance of the specified embedding provider.
     """
-    #     print(f"[DEBUG] factory.py: create_embedding_provider called with provider_type={settings.provider_type}, model_name={settings.model_name}", file=sys.stderr)
-
     if settings.provider_type == EmbeddingProviderType.FASTEMBED:
-        try:
-            #             print(f"[DEBUG] factory.py: Importing FastEmbedProvider", file=sys.stderr)
-            from mcp_server_qdrant.embeddings.fastembed import FastEmbedProvider
+        from mcp_server_qdrant.embeddings.fastembed import FastEmbedProvider
 
-            #             print(f"[DEBUG] factory.py: Creating FastEmbedProvider with model_name={settings.model_name}", file=sys.stderr)
-            provider = FastEmbedProvider(settings.model_name)
-            #             print(f"[DEBUG] factory.py: FastEmbedProvider created successfully", file=sys.stderr)
-            return provider
-        except Exception:
-            #             print(f"[ERROR] factory.py: Failed to create FastEmbedProvider: {type(e).__name__}: {e}", file=sys.stderr)
-            raise
+        return FastEmbedProvider(settings.model_name)
     else:
         raise ValueError(f"Unsupported embedding provider: {settings.provider_type}")
@@ -7,6 +7,16 @@ from fastembed.common.model_description import DenseModelDescription
 from mcp_server_qdrant.embeddings.base import EmbeddingProvider
 
 
+def _passage_embed_sync(model: TextEmbedding, documents: List[str]) -> list:
+    """Embed passages synchronously. Runs on the executor."""
+    return list(model.passage_embed(documents))
+
+
+def _query_embed_sync(model: TextEmbedding, query: str) -> list:
+    """Embed a single query synchronously. Runs on the executor."""
+    return list(model.query_embed([query]))
+
+
 class FastEmbedProvider(EmbeddingProvider):
     """
     FastEmbed implementation of the embedding provider.
@@ -33,18 +43,18 @@ class FastEmbedProvider(EmbeddingProvider):
     async def embed_documents(self, documents: List[str]) -> List[List[float]]:
         """Embed a list of documents into vectors."""
         # Run in a thread pool since FastEmbed is synchronous
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         embeddings = await loop.run_in_executor(
-            None, lambda: list(self.embedding_model.passage_embed(documents))
+            None, _passage_embed_sync, self.embedding_model, documents
         )
         return [embedding.tolist() for embedding in embeddings]
 
     async def embed_query(self, query: str) -> List[float]:
         """Embed a query into a vector."""
         # Run in a thread pool since FastEmbed is synchronous
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         embeddings = await loop.run_in_executor(
-            None, lambda: list(self.embedding_model.query_embed([query]))
+            None, _query_embed_sync, self.embedding_model, query
         )
         return embeddings[0].tolist()
 
@@ -1,33 +1,56 @@
 """
-Enhanced HTTP/SSE entry point for the mcp-server-qdrant with multi-model support.
-This variant uses streamable HTTP (SSE) transport instead of stdio.
+Enhanced HTTP entry point for the mcp-server-qdrant with multi-model support.
+This variant uses the Streamable HTTP transport instead of stdio, with SSE available on request.
 """
 
+import argparse
+import asyncio
+import logging
 import sys
 
+logger = logging.getLogger(__name__)
+
 
 def main():
     """
     Enhanced HTTP main entry point for the mcp-server-qdrant.
-    Supports collection-specific embedding models with SSE transport.
+    Supports collection-specific embedding models with Streamable HTTP transport.
 
-    Note: FastMCP's native SSE transport runs on port 8000 by default.
+    Note: FastMCP's native HTTP transports run on port 8000 by default.
     With host networking, this is directly accessible at localhost:8000.
     """
+    parser = argparse.ArgumentParser(description="mcp-server-qdrant-http")
+    parser.add_argument(
+        "--transport",
+        choices=["streamable-http", "sse"],
+        default="streamable-http",
+        help="HTTP transport to serve (Streamable HTTP has lower per-call overhead than SSE)",
+    )
+    args = parser.parse_args()
+
+    # uvloop is optional; FastMCP's event loop picks up the installed policy
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     try:
         # Use enhanced server with multi-model support
-        from mcp_server_qdrant.enhanced_server import mcp
+        from mcp_server_qdrant.enhanced_server import get_mcp
 
-        # Use FastMCP's native SSE transport
-        # It will bind to 0.0.0.0:8000 by default
-        print("Starting MCP SSE server (FastMCP native transport)", file=sys.stderr)
-        mcp.run(transport="sse")
+        mcp = get_mcp()
 
-    except Exception:
-        import traceback
+        print(
+            f"Starting MCP {args.transport} server (FastMCP native transport)",
+            file=sys.stderr,
+        )
+        mcp.run(transport=args.transport)
 
-        traceback.print_exc(file=sys.stderr)
-        sys.exit(1)
+    except Exception:
+        logger.exception("Enhanced MCP HTTP server crashed")
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
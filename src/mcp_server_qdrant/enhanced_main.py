@@ -2,9 +2,14 @@
 Enhanced main entry point for the mcp-server-qdrant with multi-model support.
 """
 
-import argparse
+import asyncio
+import logging
 import sys
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRANSPORT = "stdio"
+
 
 def main():
     """
@@ -14,44 +19,58 @@ def main():
     # print(f"[DEBUG] enhanced_main.py: Starting Enhanced MCP server", file=sys.stderr)
     # print(f"[DEBUG] enhanced_main.py: Python version: {sys.version}", file=sys.stderr)
 
-    # Parse command-line arguments
-    parser = argparse.ArgumentParser(description="mcp-server-qdrant-enhanced")
-    parser.add_argument(
-        "--transport",
-        choices=["stdio", "sse"],
-        default="stdio",
-    )
-    parser.add_argument(
-        "--legacy-mode",
-        action="store_true",
-        help="Use legacy single-model mode for backward compatibility",
-    )
-    args = parser.parse_args()
-
-    # print(f"[DEBUG] enhanced_main.py: Transport mode: {args.transport}", file=sys.stderr)
-    # print(f"[DEBUG] enhanced_main.py: Legacy mode: {args.legacy_mode}", file=sys.stderr)
+    # MCP clients usually spawn the server without arguments; skip argparse then
+    if len(sys.argv) > 1:
+        import argparse
+
+        # Parse command-line arguments
+        parser = argparse.ArgumentParser(description="mcp-server-qdrant-enhanced")
+        parser.add_argument(
+            "--transport",
+            choices=["stdio", "sse"],
+            default=DEFAULT_TRANSPORT,
+        )
+        parser.add_argument(
+            "--legacy-mode",
+            action="store_true",
+            help="Use legacy single-model mode for backward compatibility",
+        )
+        args = parser.parse_args()
+        transport, legacy_mode = args.transport, args.legacy_mode
+    else:
+        transport, legacy_mode = DEFAULT_TRANSPORT, False
 
+    # uvloop is optional; FastMCP's event loop picks up the installed policy
     try:
-        if args.legacy_mode:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    # print(f"[DEBUG] enhanced_main.py: Transport mode: {transport}", file=sys.stderr)
+    # print(f"[DEBUG] enhanced_main.py: Legacy mode: {legacy_mode}", file=sys.stderr)
+
+    try:
+        if legacy_mode:
             # Use original server for backward compatibility
             # print(f"[DEBUG] enhanced_main.py: Using legacy server mode", file=sys.stderr)
             from mcp_server_qdrant.server import mcp
         else:
             # Use enhanced server with multi-model support
             # print(f"[DEBUG] enhanced_main.py: Using enhanced server mode", file=sys.stderr)
-            from mcp_server_qdrant.enhanced_server import mcp
+            from mcp_server_qdrant.enhanced_server import get_mcp
+
+            mcp = get_mcp()
 
         # print(f"[DEBUG] enhanced_main.py: Server module imported successfully", file=sys.stderr)
-        # print(f"[DEBUG] enhanced_main.py: Starting MCP server with transport={args.transport}", file=sys.stderr)
+        # print(f"[DEBUG] enhanced_main.py: Starting MCP server with transport={transport}", file=sys.stderr)
 
-        mcp.run(transport=args.transport)
+        mcp.run(transport=transport)
 
     except Exception:
-        # print(f"[ERROR] enhanced_main.py: Exception occurred: {type(e).__name__}: {e}", file=sys.stderr)
-        import traceback
-
-        traceback.print_exc(file=sys.stderr)
-        sys.exit(1)
+        logger.exception("Enhanced MCP server crashed")
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
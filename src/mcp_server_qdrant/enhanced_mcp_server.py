@@ -2,26 +2,103 @@
 Enhanced MCP server with collection-specific embedding models and optimized configurations.
 """
 
-import json
+import asyncio
 import logging
-from typing import Any, List, Annotated
+import time
+from collections import ChainMap, defaultdict
+from contextlib import asynccontextmanager
+from xml.sax.saxutils import escape
+from typing import Any, AsyncIterator, List, Dict, Annotated, Final, Optional, Tuple
 from pydantic import Field
 from mcp.server.fastmcp import Context, FastMCP
 from mcp_server_qdrant.enhanced_qdrant import Entry, Metadata, EnhancedQdrantConnector
 from mcp_server_qdrant.enhanced_settings import (
+    COLLECTION_MODEL_MAPPINGS,
+    EMBEDDING_MODEL_CONFIGS,
     EnhancedEmbeddingProviderSettings,
     EnhancedQdrantSettings,
 )
 from mcp_server_qdrant.settings import ToolSettings
+from mcp_server_qdrant.validators import encode_metadata
 
 logger = logging.getLogger(__name__)
 
+# How long admin tool output (collection listings and details) is reused
+ADMIN_CACHE_TTL_SECONDS = 2.0
+
+# Tool descriptions, keyed by the name of the tool function
+_TOOL_DESCRIPTIONS: Final[Dict[str, str]] = {
+    "qdrant_store": 'Store documents in Qdrant collections with optional metadata. IMPORTANT: Use proper JSON syntax with double quotes (") for all keys and string values, not backticks (`). Example metadata: {"key": "value", "nested": {"data": 123}}. Auto-creates collections with optimal models: 1024D BGE-Large for career/legal content (max precision), 768D BGE-Base for knowledge-intensive content, 384D MiniLM for technical solutions (speed). Sub-100ms storage with batch support.',
+    "qdrant_find": "Search Qdrant collections with Redis caching. Uses collection-specific models for optimal results: 1024D BGE-Large (legal_analysis, technical_documentation), 768D BGE-Base (lessons_learned, contextual_knowledge), 384D MiniLM (debugging_patterns, working_solutions, music_videos). <10ms cached searches, 60-90% cache hit rate. Returns structured JSON with scores and metadata.",
+    "qdrant_list_collections": "List Qdrant collections with vector dimensions, model types, and point counts. Shows all collections with their embedding models: 1024D BGE-Large (legal/career), 768D BGE-Base (knowledge-intensive), 384D MiniLM (technical/debug). <100ms response time. Shows status (green/yellow/red) and quantization settings.",
+    "qdrant_collection_info": "Get collection details: point count, vector dimensions, HNSW parameters, quantization config. <50ms response. Returns specific error messages if collection doesn't exist or is misconfigured.",
+    "qdrant_model_mappings": "Show collection-to-model mappings with all three model tiers. 1024D BGE-Large: career/legal collections (resume_projects, legal_analysis, technical_documentation). 768D BGE-Base: knowledge-intensive collections (lessons_learned, contextual_knowledge, development_patterns). 384D MiniLM: technical/debug collections (debugging_patterns, working_solutions, music_videos). Reference for optimal collection setup.",
+}
+
+
+# Longest stretch of stored content echoed back by qdrant_store
+_STORE_PREVIEW_CHARS: Final[int] = 200
+
+# Message returned by qdrant_find when nothing matches
+_NO_RESULTS_TEMPLATE: Final[str] = (
+    "No information found for the query '{}' in collection {}"
+)
+
+# Precompiled output templates for the admin tools
+_COLLECTIONS_HEADER: Final[str] = "Qdrant Collections:\n\n"
+_MODEL_MAPPINGS_HEADER: Final[str] = "📋 **Collection Model Mappings:**\n\n"
+_MODEL_CONFIGS_HEADER: Final[str] = "📚 **Available Model Configs:**\n\n"
+_COLLECTION_ROW_TEMPLATE: Final[str] = (
+    "📊 **{collection_name}**\n"
+    "   Status: {status}\n"
+    "   Points: {points_count}\n"
+    "   Vector: {vector_name} ({dimensions}D)\n"
+    "   Model: {fastembed_model}\n\n"
+)
+_COLLECTION_ERROR_TEMPLATE: Final[str] = "❌ {name}: Error - {error}\n"
+# Fallback for row fields missing from a collection's info
+_COLLECTION_ROW_DEFAULTS: Final[Dict[str, Any]] = defaultdict(
+    lambda: "unknown", points_count=0
+)
+_COLLECTION_INFO_TEMPLATE: Final[str] = (
+    "🔍 **Collection: {name}**\n\n"
+    "**Status:** {status}\n"
+    "**Points:** {points}\n"
+    "**Indexed Vectors:** {indexed_vectors}\n\n"
+    "**Vector Configuration:**\n"
+    "   Vector Name: {vector_name}\n"
+    "   Dimensions: {dimensions}\n"
+    "   FastEmbed Model: {fastembed_model}\n\n"
+    "**Optimizations:**\n"
+    "   Quantization: {quantization}\n"
+)
+_MODEL_MAPPING_TEMPLATE: Final[str] = (
+    "**{collection}**\n"
+    "   Model: {model}\n"
+    "   Dimensions: {dimensions}\n"
+    "   FastEmbed: {fastembed_model}\n\n"
+)
+_MODEL_CONFIG_TEMPLATE: Final[str] = "**{model}**: {dimensions}D ({fastembed_model})\n"
+
 
 class EnhancedQdrantMCPServer(FastMCP):
     """
     Enhanced MCP server for Qdrant with collection-specific embedding models.
     """
 
+    # FastMCP keeps an instance __dict__, so these only turn our own attributes
+    # into fixed-offset descriptors for the attribute reads on every tool call
+    __slots__ = (
+        "tool_settings",
+        "qdrant_settings",
+        "embedding_provider_settings",
+        "qdrant_connector",
+        "_model_info_cache",
+        "_admin_cache",
+        "_debug_enabled",
+        "_model_mappings_output",
+    )
+
     def __init__(
         self,
         tool_settings: ToolSettings,
@@ -31,48 +108,131 @@ class EnhancedQdrantMCPServer(FastMCP):
         instructions: str | None = None,
         **settings: Any,
     ):
-        # print(f"[DEBUG] enhanced_mcp_server.py: EnhancedQdrantMCPServer.__init__ called", file=sys.stderr)
-
         self.tool_settings = tool_settings
         self.qdrant_settings = qdrant_settings
         self.embedding_provider_settings = embedding_provider_settings
+        self._model_info_cache: Dict[str, Tuple[str, Any]] = {}
+        self._admin_cache: Dict[str, Tuple[float, str]] = {}
+
+        self.qdrant_connector = EnhancedQdrantConnector(
+            qdrant_settings=qdrant_settings,
+            embedding_settings=embedding_provider_settings,
+            default_collection_name=qdrant_settings.collection_name,
+        )
+
+        settings.setdefault("lifespan", self._lifespan)
+
+        super().__init__(name=name, instructions=instructions, **settings)
+
+        # Client log notifications cost a transport frame per call; only send them
+        # when debugging (checked after FastMCP has configured logging)
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        try:
-            # print(f"[DEBUG] enhanced_mcp_server.py: Creating EnhancedQdrantConnector", file=sys.stderr)
-            self.qdrant_connector = EnhancedQdrantConnector(
-                qdrant_settings=qdrant_settings,
-                embedding_settings=embedding_provider_settings,
-                default_collection_name=qdrant_settings.collection_name,
+        # The mapping tables are fixed at import time, so render them once
+        self._model_mappings_output = self._render_model_mappings()
+
+        self.setup_tools()
+
+    @asynccontextmanager
+    async def _lifespan(self, server: FastMCP) -> AsyncIterator[None]:
+        """Warm up embedding models and the Qdrant connection before serving requests."""
+        warm_ups = [self.qdrant_connector.warm_up()]
+        if self.embedding_provider_settings.preload_models:
+            warm_ups.append(self.qdrant_connector._embedding_provider.warm_up())
+        await asyncio.gather(*warm_ups)
+        yield
+
+    def _cached_model_info(self, collection_name: str) -> Tuple[str, Any]:
+        """
+        Get the (vector name, dimensions) pair used to confirm stores into a collection.
+
+        The model for a collection is fixed by the settings, so the lookup is done once.
+
+        :param collection_name: Name of the collection.
+        :return: Vector name and dimensions of the collection's model.
+        """
+        model_info = self._model_info_cache.get(collection_name)
+        if model_info is None:
+            config = (
+                self.qdrant_connector._embedding_provider.get_model_info_for_collection(
+                    collection_name
+                )
             )
-            # print(f"[DEBUG] enhanced_mcp_server.py: EnhancedQdrantConnector created successfully", file=sys.stderr)
-        except Exception:
-            # print(f"[ERROR] enhanced_mcp_server.py: Failed to create EnhancedQdrantConnector: {type(e).__name__}: {e}", file=sys.stderr)
-            raise
-
-        try:
-            # print(f"[DEBUG] enhanced_mcp_server.py: Calling FastMCP.__init__", file=sys.stderr)
-            super().__init__(name=name, instructions=instructions, **settings)
-            # print(f"[DEBUG] enhanced_mcp_server.py: FastMCP.__init__ completed successfully", file=sys.stderr)
-        except Exception:
-            # print(f"[ERROR] enhanced_mcp_server.py: FastMCP.__init__ failed: {type(e).__name__}: {e}", file=sys.stderr)
-            raise
-
-        try:
-            # print(f"[DEBUG] enhanced_mcp_server.py: Setting up enhanced tools", file=sys.stderr)
-            self.setup_tools()
-            # print(f"[DEBUG] enhanced_mcp_server.py: Enhanced tools setup completed", file=sys.stderr)
-        except Exception:
-            # print(f"[ERROR] enhanced_mcp_server.py: setup_tools failed: {type(e).__name__}: {e}", file=sys.stderr)
-            raise
+            model_info = (
+                config.get("vector_name") or "unknown",
+                config.get("dimensions") or "unknown",
+            )
+            self._model_info_cache[collection_name] = model_info
+        return model_info
+
+    def _get_cached_admin_output(self, key: str) -> Optional[str]:
+        """Get admin tool output rendered within the last ADMIN_CACHE_TTL_SECONDS."""
+        hit = self._admin_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ADMIN_CACHE_TTL_SECONDS:
+            return hit[1]
+        return None
+
+    def _cache_admin_output(self, key: str, output: str) -> str:
+        """Remember admin tool output and return it."""
+        self._admin_cache[key] = (time.monotonic(), output)
+        return output
+
+    def _render_model_mappings(self) -> str:
+        """Render the qdrant_model_mappings output from the static mapping tables."""
+        parts = [_MODEL_MAPPINGS_HEADER]
+
+        for collection, model in COLLECTION_MODEL_MAPPINGS.items():
+            config = EMBEDDING_MODEL_CONFIGS.get(model)
+            parts.append(
+                _MODEL_MAPPING_TEMPLATE.format_map(
+                    {
+                        "collection": collection,
+                        "model": model,
+                        "dimensions": config.dimensions if config else "unknown",
+                        "fastembed_model": (
+                            config.fastembed_model if config else "unknown"
+                        ),
+                    }
+                )
+            )
+
+        parts.append(_MODEL_CONFIGS_HEADER)
+        for model, config in EMBEDDING_MODEL_CONFIGS.items():
+            parts.append(
+                _MODEL_CONFIG_TEMPLATE.format_map(
+                    {
+                        "model": model,
+                        "dimensions": config.dimensions,
+                        "fastembed_model": config.fastembed_model,
+                    }
+                )
+            )
+
+        return "".join(parts)
 
     def format_entry(self, entry: Entry) -> str:
         """Format entry for display."""
-        entry_metadata = json.dumps(entry.metadata) if entry.metadata else ""
-        return f"<entry><content>{entry.content}</content><metadata>{entry_metadata}</metadata></entry>"
+        content = entry.content
+        # Most content has no markup, so only pay for escaping when it does
+        if "<" in content or ">" in content or "&" in content:
+            content = escape(content)
+        entry_metadata = encode_metadata(entry.metadata) if entry.metadata else ""
+        return f"<entry><content>{content}</content><metadata>{entry_metadata}</metadata></entry>"
 
     def setup_tools(self):
         """Register the enhanced tools in the server."""
 
+        # Bind what the tools use once here instead of looking it up on every call
+        connector = self.qdrant_connector
+        admin_cache = self._admin_cache
+        cached_model_info = self._cached_model_info
+        search_limit = self.qdrant_settings.search_limit
+        format_entry = self.format_entry
+        get_cached_admin_output = self._get_cached_admin_output
+        cache_admin_output = self._cache_admin_output
+        debug_enabled = self._debug_enabled
+        model_mappings_output = self._model_mappings_output
+
         async def qdrant_store(
             ctx: Context,
             information: Annotated[
@@ -104,23 +264,26 @@ class EnhancedQdrantMCPServer(FastMCP):
             :param metadata: Optional JSON metadata object to store alongside the document. Can be any valid JSON structure with unlimited nesting. Use for categorization, filtering, and additional context. Example: {"category": "tutorial", "tags": ["python"], "author": {"name": "John"}}.
             :return: A message indicating that the information was stored.
             """
-            await ctx.debug(
-                f"Enhanced storing information in collection {collection_name}"
-            )
+            if debug_enabled:
+                await ctx.debug(
+                    f"Enhanced storing information in collection {collection_name}"
+                )
 
             entry = Entry(content=information, metadata=metadata)
-            await self.qdrant_connector.store(entry, collection_name=collection_name)
+            await connector.store(entry, collection_name=collection_name)
+            # Point counts (and possibly the collection list) just changed
+            admin_cache.clear()
 
-            # Get model info for confirmation
-            model_info = (
-                self.qdrant_connector._embedding_provider.get_model_info_for_collection(
-                    collection_name
-                )
+            vector_name, dimensions = cached_model_info(collection_name)
+
+            # Large documents would otherwise be sent straight back to the client
+            preview = (
+                information
+                if len(information) <= _STORE_PREVIEW_CHARS
+                else information[:_STORE_PREVIEW_CHARS] + "..."
             )
-            vector_name = model_info.get("vector_name", "unknown")
-            dimensions = model_info.get("dimensions", "unknown")
 
-            return f"Stored in {collection_name} using {vector_name} ({dimensions}D): {information}"
+            return f"Stored in {collection_name} using {vector_name} ({dimensions}D): {preview}"
 
         async def qdrant_find(
             ctx: Context,
@@ -145,22 +308,25 @@ class EnhancedQdrantMCPServer(FastMCP):
             :param collection_name: Name of the existing collection to search within. Must be a valid, existing collection name. Non-existent collections will return "No information found" message.
             :return: A list of entries found.
             """
-            await ctx.debug(
-                f"Enhanced searching in collection {collection_name} for: {query}"
-            )
+            if debug_enabled:
+                await ctx.debug(
+                    f"Enhanced searching in collection {collection_name} for: {query}"
+                )
 
-            entries = await self.qdrant_connector.search(
+            entries = await connector.search_coalesced(
                 query,
                 collection_name=collection_name,
-                limit=self.qdrant_settings.search_limit,
+                limit=search_limit,
             )
 
+            # Let progress-aware clients know the vector search is done before
+            # the results are formatted; a no-op without a progress token
+            await ctx.report_progress(1, 2, message=f"Found {len(entries)} results")
+
             if not entries:
-                return [
-                    f"No information found for the query '{query}' in collection {collection_name}"
-                ]
+                return [_NO_RESULTS_TEMPLATE.format(query, collection_name)]
 
-            return [self.format_entry(entry) for entry in entries]
+            return list(map(format_entry, entries))
 
         async def qdrant_list_collections(ctx: Context) -> str:
             """
@@ -169,32 +335,44 @@ class EnhancedQdrantMCPServer(FastMCP):
             :param ctx: The context for the request.
             :return: Formatted list of collections with their info.
             """
-            await ctx.debug("Listing all collections with enhanced info")
+            if debug_enabled:
+                await ctx.debug("Listing all collections with enhanced info")
+
+            cached = get_cached_admin_output("list_collections")
+            if cached is not None:
+                return cached
 
             try:
-                collections_info = (
-                    await self.qdrant_connector.list_collections_with_info()
-                )
+                collections_info = await connector.list_collections_with_info()
 
                 if not collections_info:
                     return "No collections found in Qdrant."
 
-                result = "Qdrant Collections:\n\n"
+                parts = [_COLLECTIONS_HEADER]
                 for info in collections_info:
                     if "error" in info:
-                        result += (
-                            f"❌ {info['collection_name']}: Error - {info['error']}\n"
+                        parts.append(
+                            _COLLECTION_ERROR_TEMPLATE.format_map(
+                                {
+                                    "name": info["collection_name"],
+                                    "error": info["error"],
+                                }
+                            )
                         )
                         continue
 
-                    vector_config = info.get("vector_config", {})
-                    result += f"📊 **{info['collection_name']}**\n"
-                    result += f"   Status: {info.get('status', 'unknown')}\n"
-                    result += f"   Points: {info.get('points_count', 0)}\n"
-                    result += f"   Vector: {vector_config.get('vector_name', 'unknown')} ({vector_config.get('dimensions', 'unknown')}D)\n"
-                    result += f"   Model: {vector_config.get('fastembed_model', 'unknown')}\n\n"
+                    # Row fields are read straight from the info and its vector config
+                    parts.append(
+                        _COLLECTION_ROW_TEMPLATE.format_map(
+                            ChainMap(
+                                info,
+                                info.get("vector_config") or {},
+                                _COLLECTION_ROW_DEFAULTS,
+                            )
+                        )
+                    )
 
-                return result
+                return cache_admin_output("list_collections", "".join(parts))
 
             except Exception as e:
                 return f"Error listing collections: {str(e)}"
@@ -215,41 +393,44 @@ class EnhancedQdrantMCPServer(FastMCP):
             :param collection_name: Name of the collection to inspect and get detailed information about. Can be any string - will return error message if collection doesn't exist or is inaccessible. Returns status, document count, vector configuration, optimization settings, and model information.
             :return: Detailed collection information.
             """
-            await ctx.debug(f"Getting detailed info for collection: {collection_name}")
+            if debug_enabled:
+                await ctx.debug(
+                    f"Getting detailed info for collection: {collection_name}"
+                )
+
+            cache_key = f"collection_info:{collection_name}"
+            cached = get_cached_admin_output(cache_key)
+            if cached is not None:
+                return cached
 
             try:
-                info = await self.qdrant_connector.get_collection_info(collection_name)
+                info = await connector.get_collection_info(collection_name)
 
                 if "error" in info:
                     return f"Error getting info for {collection_name}: {info['error']}"
 
-                vector_config = info.get("vector_config", {})
-                config = info.get("config", {})
-
-                result = f"🔍 **Collection: {collection_name}**\n\n"
-                result += f"**Status:** {info.get('status', 'unknown')}\n"
-                result += f"**Points:** {info.get('points_count', 0)}\n"
-                result += (
-                    f"**Indexed Vectors:** {info.get('indexed_vectors_count', 0)}\n\n"
-                )
-
-                result += "**Vector Configuration:**\n"
-                result += (
-                    f"   Vector Name: {vector_config.get('vector_name', 'unknown')}\n"
-                )
-                result += (
-                    f"   Dimensions: {vector_config.get('dimensions', 'unknown')}\n"
+                vector_config = info.get("vector_config") or {}
+                config = info.get("config") or {}
+
+                return cache_admin_output(
+                    cache_key,
+                    _COLLECTION_INFO_TEMPLATE.format_map(
+                        {
+                            "name": collection_name,
+                            "status": info.get("status", "unknown"),
+                            "points": info.get("points_count", 0),
+                            "indexed_vectors": info.get("indexed_vectors_count", 0),
+                            "vector_name": vector_config.get("vector_name", "unknown"),
+                            "dimensions": vector_config.get("dimensions", "unknown"),
+                            "fastembed_model": vector_config.get(
+                                "fastembed_model", "unknown"
+                            ),
+                            "quantization": "Enabled"
+                            if config.get("quantization_config")
+                            else "Disabled",
+                        }
+                    ),
                 )
-                result += f"   FastEmbed Model: {vector_config.get('fastembed_model', 'unknown')}\n\n"
-
-                if config.get("quantization_config"):
-                    result += "**Optimizations:**\n"
-                    result += "   Quantization: Enabled\n"
-                else:
-                    result += "**Optimizations:**\n"
-                    result += "   Quantization: Disabled\n"
-
-                return result
 
             except Exception as e:
                 return f"Error getting collection info: {str(e)}"
@@ -261,47 +442,17 @@ class EnhancedQdrantMCPServer(FastMCP):
             :param ctx: The context for the request.
             :return: Current model mappings configuration.
             """
-            await ctx.debug("Showing collection-to-model mappings")
-
-            from mcp_server_qdrant.enhanced_settings import (
-                COLLECTION_MODEL_MAPPINGS,
-                EMBEDDING_MODEL_CONFIGS,
-            )
+            if debug_enabled:
+                await ctx.debug("Showing collection-to-model mappings")
 
-            result = "📋 **Collection Model Mappings:**\n\n"
-
-            for collection, model in COLLECTION_MODEL_MAPPINGS.items():
-                config = EMBEDDING_MODEL_CONFIGS.get(model, {})
-                result += f"**{collection}**\n"
-                result += f"   Model: {model}\n"
-                result += f"   Dimensions: {config.get('dimensions', 'unknown')}\n"
-                result += (
-                    f"   FastEmbed: {config.get('fastembed_model', 'unknown')}\n\n"
-                )
-
-            result += "📚 **Available Model Configs:**\n\n"
-            for model, config in EMBEDDING_MODEL_CONFIGS.items():
-                result += f"**{model}**: {config.get('dimensions')}D ({config.get('fastembed_model')})\n"
-
-            return result
+            return model_mappings_output
 
         # Register tools with optimized descriptions (based on lessons learned)
-        self.tool(
-            description='Store documents in Qdrant collections with optional metadata. IMPORTANT: Use proper JSON syntax with double quotes (") for all keys and string values, not backticks (`). Example metadata: {"key": "value", "nested": {"data": 123}}. Auto-creates collections with optimal models: 1024D BGE-Large for career/legal content (max precision), 768D BGE-Base for knowledge-intensive content, 384D MiniLM for technical solutions (speed). Sub-100ms storage with batch support.'
-        )(qdrant_store)
-
-        self.tool(
-            description="Search Qdrant collections with Redis caching. Uses collection-specific models for optimal results: 1024D BGE-Large (legal_analysis, technical_documentation), 768D BGE-Base (lessons_learned, contextual_knowledge), 384D MiniLM (debugging_patterns, working_solutions, music_videos). <10ms cached searches, 60-90% cache hit rate. Returns structured JSON with scores and metadata."
-        )(qdrant_find)
-
-        self.tool(
-            description="List Qdrant collections with vector dimensions, model types, and point counts. Shows all collections with their embedding models: 1024D BGE-Large (legal/career), 768D BGE-Base (knowledge-intensive), 384D MiniLM (technical/debug). <100ms response time. Shows status (green/yellow/red) and quantization settings."
-        )(qdrant_list_collections)
-
-        self.tool(
-            description="Get collection details: point count, vector dimensions, HNSW parameters, quantization config. <50ms response. Returns specific error messages if collection doesn't exist or is misconfigured."
-        )(qdrant_collection_info)
-
-        self.tool(
-            description="Show collection-to-model mappings with all three model tiers. 1024D BGE-Large: career/legal collections (resume_projects, legal_analysis, technical_documentation). 768D BGE-Base: knowledge-intensive collections (lessons_learned, contextual_knowledge, development_patterns). 384D MiniLM: technical/debug collections (debugging_patterns, working_solutions, music_videos). Reference for optimal collection setup."
-        )(qdrant_model_mappings)
+        for tool in (
+            qdrant_store,
+            qdrant_find,
+            qdrant_list_collections,
+            qdrant_collection_info,
+            qdrant_model_mappings,
+        ):
+            self.tool(description=_TOOL_DESCRIPTIONS[tool.__name__])(tool)
@@ -4,16 +4,20 @@ Enhanced Qdrant connector with collection-specific embedding models and optimize
 
 import logging
 import sys
+import time
 import uuid
 import asyncio
-from typing import Any, Dict, Optional, List
-from pydantic import BaseModel, validator
-from qdrant_client import AsyncQdrantClient, models
+from contextlib import AsyncExitStack, asynccontextmanager, nullcontext
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional, List, Tuple
+from pydantic import BaseModel, field_validator
+from qdrant_client import models
+from mcp_server_qdrant.clients import get_async_client
 from mcp_server_qdrant.embeddings.enhanced_fastembed import EnhancedFastEmbedProvider
 from mcp_server_qdrant.enhanced_settings import (
     EnhancedEmbeddingProviderSettings,
     EnhancedQdrantSettings,
 )
+from mcp_server_qdrant.semantic_cache import SemanticCache
 from mcp_server_qdrant.validators import (
     validate_search_results,
     sanitize_query,
@@ -24,6 +28,48 @@ logger = logging.getLogger(__name__)
 
 Metadata = Dict[str, Any]
 
+# Maximum number of point IDs sent in a single delete request
+DELETE_BATCH_SIZE = 1000
+
+# get_collection requests list_collections_with_info keeps in flight
+COLLECTION_INFO_CONCURRENCY = 16
+
+# How long a collection confirmed to exist is trusted before asking Qdrant again
+COLLECTION_EXISTS_TTL_SECONDS = 60.0
+
+# HNSW indexing threshold (in KB of vectors) for collections created here
+INDEXING_THRESHOLD = 10000
+
+# bulk_store calls at least this large pause indexing until every batch is stored
+BULK_INDEXING_PAUSE_MIN_ENTRIES = 5000
+
+# Collections created with at least this many dimensions use binary or scalar
+# quantization when QDRANT_ENABLE_QUANTIZATION is on
+BINARY_QUANTIZATION_MIN_DIMENSIONS = 1024
+SCALAR_QUANTIZATION_MIN_DIMENSIONS = 512
+
+# Candidates fetched per result from binary-quantized vectors before rescoring
+BINARY_QUANTIZATION_OVERSAMPLING = 2.0
+
+# Namespace for point IDs derived from the collection and content, so storing the
+# same content again overwrites the existing point instead of duplicating it
+POINT_ID_NAMESPACE = uuid.UUID("5a0f3e52-8c1d-4b7a-9f1e-6d2c3b4a5e60")
+
+# Concurrent searches on one collection are coalesced into a single batch request
+SEARCH_BATCH_MAX = 64
+SEARCH_BATCH_WINDOW_SECONDS = 0.003
+
+# A collection's batching worker exits after its queue has been idle this long
+SEARCH_WORKER_IDLE_SECONDS = 60.0
+
+# Coalesced searches are retried by each caller with exponential backoff
+SEARCH_MAX_RETRIES = 3
+
+
+def content_point_id(collection_name: str, content: str) -> str:
+    """Get the deterministic point ID for content stored in a collection."""
+    return uuid.uuid5(POINT_ID_NAMESPACE, f"{collection_name}:{content}").hex
+
 
 class SearchResult(BaseModel):
     """Enhanced search result with score and metadata."""
@@ -47,13 +93,15 @@ class Entry(BaseModel):
     content: str
     metadata: Optional[Metadata] = None
 
-    @validator("content")
+    @field_validator("content")
+    @classmethod
     def content_must_not_be_empty(cls, v):
         if not v or not v.strip():
             raise ValueError("Content cannot be empty")
         return v.strip()
 
-    @validator("metadata")
+    @field_validator("metadata")
+    @classmethod
     def metadata_must_be_valid(cls, v):
         if v is not None and not validate_metadata(v):
             raise ValueError("Invalid metadata format")
@@ -77,6 +125,10 @@ class Entry(BaseModel):
         )
 
 
+# (query, limit, score_threshold, future) awaiting a batched search
+PendingSearch = Tuple[str, int, float, "asyncio.Future[List[SearchResult]]"]
+
+
 class EnhancedQdrantConnector:
     """
     Enhanced Qdrant connector that supports collection-specific embedding models and optimized configurations.
@@ -88,105 +140,150 @@ class EnhancedQdrantConnector:
         embedding_settings: EnhancedEmbeddingProviderSettings,
         default_collection_name: Optional[str] = None,
     ):
-        # print(f"[DEBUG] enhanced_qdrant.py: EnhancedQdrantConnector.__init__ called", file=sys.stderr)
-
         self._qdrant_settings = qdrant_settings
         self._embedding_settings = embedding_settings
         self._default_collection_name = default_collection_name
 
+        # Collection name -> when it was last confirmed to exist
+        self._known_collections: Dict[str, float] = {}
+        # Collection name -> bulk writes currently pausing its indexing, and the
+        # indexing threshold to restore once the last of them finishes
+        self._indexing_pause_counts: Dict[str, int] = {}
+        self._indexing_restore_thresholds: Dict[str, int] = {}
+        self._search_queues: Dict[str, "asyncio.Queue[PendingSearch]"] = {}
+        self._search_workers: Dict[str, "asyncio.Task[None]"] = {}
+        self._semantic_cache = (
+            SemanticCache(
+                threshold=qdrant_settings.semantic_cache_threshold,
+                max_entries=qdrant_settings.semantic_cache_size,
+                ttl_seconds=qdrant_settings.semantic_cache_ttl,
+            )
+            if qdrant_settings.semantic_cache_enabled
+            else None
+        )
+
         # Create enhanced embedding provider
         self._embedding_provider = EnhancedFastEmbedProvider(
             embedding_settings=embedding_settings,
             default_model=embedding_settings.model_name,
         )
 
-        try:
-            # print(f"[DEBUG] enhanced_qdrant.py: Creating AsyncQdrantClient", file=sys.stderr)
-            self._client = AsyncQdrantClient(
-                location=qdrant_settings.location,
-                api_key=qdrant_settings.api_key,
-                path=qdrant_settings.local_path,
-            )
-            # print(f"[DEBUG] enhanced_qdrant.py: AsyncQdrantClient created successfully", file=sys.stderr)
-        except Exception:
-            # print(f"[ERROR] enhanced_qdrant.py: Failed to create AsyncQdrantClient: {type(e).__name__}: {e}", file=sys.stderr)
-            raise
-
-    async def _ensure_connection(self) -> None:
-        """Ensure Qdrant connection with retry logic."""
-        max_retries = 3
-        base_delay = 2.0
-
-        for attempt in range(max_retries):
-            try:
-                # Test connection
-                collections = await self._client.get_collections()
-                logger.info(
-                    f"Connected to Qdrant, found {len(collections.collections)} collections"
-                )
-                return
-
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    logger.error(
-                        f"Failed to connect to Qdrant after {max_retries} attempts: {e}"
-                    )
-                    raise ConnectionError(f"Cannot connect to Qdrant: {e}")
+        self._client = get_async_client(
+            location=qdrant_settings.location,
+            api_key=qdrant_settings.api_key,
+            path=qdrant_settings.local_path,
+            grpc_port=qdrant_settings.grpc_port,
+            prefer_grpc=qdrant_settings.prefer_grpc,
+        )
 
-                delay = base_delay * (2**attempt)
-                logger.warning(
-                    f"Connection attempt {attempt + 1} failed, retrying in {delay}s: {e}"
-                )
-                await asyncio.sleep(delay)
+    async def warm_up(self) -> None:
+        """Open the Qdrant connection ahead of the first request, if the server is up."""
+        try:
+            await self._client.get_collections()
+        except Exception as e:
+            logger.warning(f"Qdrant warm-up failed, connecting on first request: {e}")
+
+    def _invalidate_search_cache(self, collection_name: str) -> None:
+        """Drop cached search results for a collection after writing to it."""
+        if self._semantic_cache is not None:
+            self._semantic_cache.invalidate(collection_name)
+
+    async def _collection_exists(self, collection_name: str) -> bool:
+        """Check that a collection exists, trusting a recent positive answer."""
+        checked_at = self._known_collections.get(collection_name)
+        if (
+            checked_at is not None
+            and time.monotonic() - checked_at < COLLECTION_EXISTS_TTL_SECONDS
+        ):
+            return True
+
+        exists = await self._client.collection_exists(collection_name)
+        if exists:
+            self._known_collections[collection_name] = time.monotonic()
+        else:
+            self._known_collections.pop(collection_name, None)
+        return exists
 
     async def get_collection_names(self) -> list[str]:
         """Get the names of all collections in the Qdrant server."""
         response = await self._client.get_collections()
         return [collection.name for collection in response.collections]
 
+    async def _prepare_write(self, collection_name: str) -> str:
+        """
+        Get a collection ready for writes: create it if needed and point the embedding
+        provider at it.
+
+        :return: The name of the vector to write.
+        """
+        await self._ensure_collection_exists(collection_name)
+        self._embedding_provider.set_collection_context(collection_name)
+        return self._embedding_provider.get_vector_name(collection_name)
+
+    @staticmethod
+    def _point_columns(
+        collection_name: str, entries: List[Entry]
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Build the point IDs and payloads for entries, in entry order."""
+        ids = [content_point_id(collection_name, entry.content) for entry in entries]
+        payloads = [
+            {"document": entry.content, "metadata": entry.metadata} for entry in entries
+        ]
+        return ids, payloads
+
     async def store(self, entry: Entry, *, collection_name: Optional[str] = None):
         """
         Store information in the Qdrant collection with collection-specific embedding.
         """
+        await self.store_many([entry], collection_name=collection_name)
+
+    async def store_many(
+        self, entries: List[Entry], *, collection_name: Optional[str] = None
+    ) -> None:
+        """
+        Store entries with one embedding call and one upsert request.
+
+        Unlike bulk_store, nothing is streamed or split into batches, so this suits
+        a handful of entries that should land together.
+
+        :param entries: Entries to store.
+        :param collection_name: Target collection (uses default if None).
+        """
         collection_name = collection_name or self._default_collection_name
         assert collection_name is not None
 
-        # Ensure collection exists with proper configuration
-        await self._ensure_collection_exists(collection_name)
+        if not entries:
+            return
 
-        # Set collection context for embedding provider
-        self._embedding_provider.set_collection_context(collection_name)
+        vector_name = await self._prepare_write(collection_name)
 
-        # Embed the document using collection-specific model
+        # Embed the documents using collection-specific model
         print(
             f"[DEBUG] enhanced_qdrant.py: Starting store for collection '{collection_name}'",
             file=sys.stderr,
         )
         embeddings = await self._embedding_provider.embed_documents(
-            [entry.content], collection_name
+            [entry.content for entry in entries], collection_name
         )
-
-        # Get collection-specific vector name
-        vector_name = self._embedding_provider.get_vector_name(collection_name)
         print(
             f"[DEBUG] enhanced_qdrant.py: Using vector_name '{vector_name}' for store in collection '{collection_name}'",
             file=sys.stderr,
         )
 
-        # Prepare payload
-        payload = {"document": entry.content, "metadata": entry.metadata}
-
         # Store in Qdrant
-        await self._client.upsert(
-            collection_name=collection_name,
-            points=[
-                models.PointStruct(
-                    id=uuid.uuid4().hex,
-                    vector={vector_name: embeddings[0]},
-                    payload=payload,
-                )
-            ],
-        )
+        ids, payloads = self._point_columns(collection_name, entries)
+        try:
+            await self._client.upsert(
+                collection_name=collection_name,
+                points=models.Batch(
+                    ids=ids, vectors={vector_name: embeddings}, payloads=payloads
+                ),
+            )
+        except Exception:
+            # The collection may have been dropped since it was last checked
+            self._known_collections.pop(collection_name, None)
+            raise
+        self._invalidate_search_cache(collection_name)
 
     async def bulk_store(
         self,
@@ -194,6 +291,7 @@ class EnhancedQdrantConnector:
         *,
         collection_name: Optional[str] = None,
         batch_size: int = 100,
+        max_concurrent_batches: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Store multiple entries efficiently using collection-specific embedding models.
@@ -202,69 +300,246 @@ class EnhancedQdrantConnector:
             entries: List of Entry objects to store
             collection_name: Target collection (uses default if None)
             batch_size: Number of entries to process in each batch
+            max_concurrent_batches: Upsert requests kept in flight at once
+                (defaults to QDRANT_BULK_UPSERT_CONCURRENCY)
 
         Returns:
-            Dictionary with storage results and statistics
+            Dictionary with storage results and statistics; batches whose upsert
+            failed are counted in failed_batches, and entries whose embedding
+            failed are skipped batch by batch and counted in unembedded_count
         """
         collection_name = collection_name or self._default_collection_name
         if not collection_name:
             raise ValueError("Collection name must be specified")
 
         if not entries:
-            return {"success": True, "stored_count": 0, "batch_count": 0}
+            return {
+                "success": True,
+                "stored_count": 0,
+                "batch_count": 0,
+                "failed_batches": 0,
+                "unembedded_count": 0,
+            }
 
-        # Ensure collection exists with proper configuration
-        await self._ensure_collection_exists(collection_name)
+        vector_name = await self._prepare_write(collection_name)
 
-        # Set collection context for embedding provider
-        self._embedding_provider.set_collection_context(collection_name)
-
-        # Get collection-specific vector name
-        vector_name = self._embedding_provider.get_vector_name(collection_name)
+        # Embed longest first so each model batch pads to similar lengths; point IDs
+        # come from the content, so the storage order doesn't matter
+        entries = sorted(entries, key=lambda entry: len(entry.content), reverse=True)
 
         total_stored = 0
         batch_count = 0
+        failed_batches = 0
+        unembedded_count = 0
+
+        # Large ingests build the HNSW graph once at the end instead of per batch
+        indexing = (
+            self._indexing_paused(collection_name)
+            if len(entries) >= BULK_INDEXING_PAUSE_MIN_ENTRIES
+            else nullcontext()
+        )
+        async with indexing:
+            # Upserts run as tasks so embedding continues while earlier batches are sent
+            semaphore = asyncio.Semaphore(
+                max_concurrent_batches or self._qdrant_settings.bulk_upsert_concurrency
+            )
+            upserts: List["asyncio.Task[None]"] = []
+            stored_batch: Optional[models.Batch] = None
 
-        # Process entries in batches
-        for i in range(0, len(entries), batch_size):
-            batch = entries[i : i + batch_size]
-            batch_texts = [entry.content for entry in batch]
-
-            try:
-                # Embed all texts in the batch using collection-specific model
-                embeddings = await self._embedding_provider.embed_documents(
-                    batch_texts, collection_name
+            async def upsert_batch(
+                batch: models.Batch, number: int, wait: bool
+            ) -> None:
+                nonlocal total_stored, batch_count, failed_batches, stored_batch
+                try:
+                    await self._client.upsert(
+                        collection_name=collection_name, points=batch, wait=wait
+                    )
+                    total_stored += len(batch.ids)
+                    batch_count += 1
+                    stored_batch = batch
+                except Exception as e:
+                    failed_batches += 1
+                    logger.error(f"Batch {number} failed: {e}")
+                    # Continue with remaining batches rather than failing completely
+                finally:
+                    semaphore.release()
+
+            async def dispatch_batch(batch: models.Batch) -> None:
+                # Wait for a free slot so memory and server load stay bounded
+                await semaphore.acquire()
+                # Intermediate batches are acknowledged once Qdrant has logged them
+                # rather than applied; the final batch waits (see below)
+                upserts.append(
+                    asyncio.create_task(
+                        upsert_batch(batch, len(upserts) + 1, wait=False)
+                    )
                 )
 
-                # Prepare points for batch upsert
-                points = []
-                for j, (entry, embedding) in enumerate(zip(batch, embeddings)):
-                    payload = {"document": entry.content, "metadata": entry.metadata}
-                    points.append(
-                        models.PointStruct(
-                            id=uuid.uuid4().hex,  # Keep using UUID for backward compatibility
-                            vector={vector_name: embedding},
-                            payload=payload,
-                        )
+            # Points are sent column-wise as one Batch per request instead of building
+            # a PointStruct model per entry. IDs and payloads don't depend on the
+            # embeddings, so they are built in one pass up front and sliced per batch
+            ids, payloads = self._point_columns(collection_name, entries)
+            vectors: List[List[float]] = []
+            start = 0
+
+            def take_batch() -> models.Batch:
+                nonlocal vectors, start
+                end = start + len(vectors)
+                batch = models.Batch(
+                    ids=ids[start:end],
+                    vectors={vector_name: vectors},
+                    payloads=payloads[start:end],
+                )
+                vectors, start = [], end
+                return batch
+
+            # Stream embeddings so each batch is upserted while later ones are embedded
+            contents = [entry.content for entry in entries]
+            index = 0
+            while index < len(entries):
+                embeddings = self._embedding_provider.aiter_embed_documents(
+                    contents[index:] if index else contents, collection_name
+                )
+                try:
+                    async for embedding in embeddings:
+                        vectors.append(embedding)
+                        index += 1
+                        if len(vectors) >= batch_size and index < len(entries):
+                            await dispatch_batch(take_batch())
+                except Exception as e:
+                    # Skip only the batch being embedded, like a failed upsert, and
+                    # restart the stream after it
+                    failed_end = min(start + batch_size, len(entries))
+                    logger.error(
+                        f"Embedding failed for entries {start}-{failed_end} "
+                        f"of {len(entries)}: {e}"
+                    )
+                    unembedded_count += failed_end - start
+                    vectors, start, index = [], failed_end, failed_end
+                else:
+                    break
+                finally:
+                    await embeddings.aclose()
+
+            await asyncio.gather(*upserts)
+            if vectors:
+                # Sent after every other batch was acknowledged, so waiting for this one
+                # to be applied means the whole ingest is visible to searches on return
+                await semaphore.acquire()
+                await upsert_batch(take_batch(), len(upserts) + 1, wait=True)
+            elif stored_batch is not None:
+                # The final batch failed to embed, so re-send one that was stored with
+                # wait=True instead; its point IDs make the repeat a no-op
+                try:
+                    await self._client.upsert(
+                        collection_name=collection_name, points=stored_batch, wait=True
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Waiting for stored batches to be applied failed: {e}"
                     )
 
-                # Batch upsert to Qdrant
-                await self._client.upsert(
-                    collection_name=collection_name, points=points
-                )
+        self._invalidate_search_cache(collection_name)
 
-                total_stored += len(batch)
-                batch_count += 1
+        return {
+            "success": not failed_batches and not unembedded_count,
+            "stored_count": total_stored,
+            "batch_count": batch_count,
+            "failed_batches": failed_batches,
+            "unembedded_count": unembedded_count,
+            "collection_name": collection_name,
+            "vector_model": self._embedding_provider.get_model_info_for_collection(
+                collection_name
+            ),
+        }
 
-            except Exception as e:
-                logger.error(f"Batch {batch_count + 1} failed: {e}")
-                # Continue with remaining batches rather than failing completely
-                continue
+    async def bulk_store_stream(
+        self,
+        entries: AsyncIterable[Entry],
+        *,
+        collection_name: Optional[str] = None,
+        batch_size: int = 100,
+        max_concurrent_batches: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Store entries from an async iterable without holding them all in memory.
+
+        Entries are read in chunks of one batch per concurrent upsert, and each chunk
+        goes through bulk_store while the next one is read, so at most two chunks are
+        held at a time. Once the stream reaches BULK_INDEXING_PAUSE_MIN_ENTRIES,
+        indexing is paused until every chunk is stored.
+
+        Args:
+            entries: Async iterable of Entry objects to store
+            collection_name: Target collection (uses default if None)
+            batch_size: Number of entries to process in each batch
+            max_concurrent_batches: Upsert requests kept in flight at once
+                (defaults to QDRANT_BULK_UPSERT_CONCURRENCY)
+
+        Returns:
+            Dictionary with storage results and statistics
+        """
+        collection_name = collection_name or self._default_collection_name
+        if not collection_name:
+            raise ValueError("Collection name must be specified")
+
+        max_concurrent_batches = (
+            max_concurrent_batches or self._qdrant_settings.bulk_upsert_concurrency
+        )
+        chunk_size = batch_size * max_concurrent_batches
+
+        total_stored = 0
+        batch_count = 0
+        failed_batches = 0
+        unembedded_count = 0
+
+        async def store_chunk(chunk: List[Entry]) -> None:
+            nonlocal total_stored, batch_count, failed_batches, unembedded_count
+            result = await self.bulk_store(
+                chunk,
+                collection_name=collection_name,
+                batch_size=batch_size,
+                max_concurrent_batches=max_concurrent_batches,
+            )
+            total_stored += result["stored_count"]
+            batch_count += result["batch_count"]
+            failed_batches += result["failed_batches"]
+            unembedded_count += result["unembedded_count"]
+
+        chunk: List[Entry] = []
+        previous: Optional["asyncio.Task[None]"] = None
+        read = 0
+        async with AsyncExitStack() as stack:
+            try:
+                async for entry in entries:
+                    chunk.append(entry)
+                    read += 1
+                    if read == BULK_INDEXING_PAUSE_MIN_ENTRIES:
+                        # The stream's length isn't known up front, so pause once it
+                        # is long enough
+                        await self._ensure_collection_exists(collection_name)
+                        await stack.enter_async_context(
+                            self._indexing_paused(collection_name)
+                        )
+                    if len(chunk) >= chunk_size:
+                        if previous is not None:
+                            await previous
+                        previous = asyncio.create_task(store_chunk(chunk))
+                        chunk = []
+                if previous is not None:
+                    await previous
+                if chunk:
+                    await store_chunk(chunk)
+            finally:
+                if previous is not None and not previous.done():
+                    previous.cancel()
 
         return {
-            "success": True,
+            "success": not failed_batches and not unembedded_count,
             "stored_count": total_stored,
             "batch_count": batch_count,
+            "failed_batches": failed_batches,
+            "unembedded_count": unembedded_count,
             "collection_name": collection_name,
             "vector_model": self._embedding_provider.get_model_info_for_collection(
                 collection_name
@@ -299,8 +574,7 @@ class EnhancedQdrantConnector:
         if not collection_name:
             raise ValueError("Collection name must be specified")
 
-        collection_exists = await self._client.collection_exists(collection_name)
-        if not collection_exists:
+        if not await self._collection_exists(collection_name):
             return []
 
         # Set collection context for embedding provider
@@ -329,31 +603,20 @@ class EnhancedQdrantConnector:
                 limit=limit,
             )
 
-            # Validate and filter results
-            validated_results = validate_search_results(search_results.points)
-
-            # Convert to SearchResult objects
-            structured_results = []
-            for result in validated_results:
-                if result.score >= score_threshold:
-                    entry = Entry(
-                        content=result.payload["document"],
-                        metadata=result.payload.get("metadata"),
-                    )
-                    search_result = entry.to_search_result(
-                        score=result.score if include_score else 1.0,
-                        collection_name=collection_name,
-                        vector_name=vector_name,
-                        point_id=str(result.id),  # Capture point ID for updates
-                    )
-                    structured_results.append(search_result)
-
-            # Sort by score (highest first)
-            structured_results.sort(key=lambda x: x.score, reverse=True)
+            structured_results = self._to_search_results(
+                search_results.points,
+                collection_name=collection_name,
+                vector_name=vector_name,
+                score_threshold=score_threshold,
+                include_score=include_score,
+            )
 
             return structured_results[:limit]
 
         except Exception as e:
+            # The collection may have been dropped since it was last checked
+            self._known_collections.pop(collection_name, None)
+
             # Enhanced error handling for named vector collections
             error_msg = str(e).lower()
             if "vector name" in error_msg or "using" in error_msg:
@@ -380,6 +643,268 @@ class EnhancedQdrantConnector:
             )
             raise
 
+    def _to_search_results(
+        self,
+        points: List[Any],
+        collection_name: str,
+        vector_name: str,
+        score_threshold: float,
+        include_score: bool = True,
+    ) -> List[SearchResult]:
+        """
+        Validate scored points and convert them to SearchResult objects.
+
+        Qdrant returns points best first and filtering keeps that order, so the
+        results are not re-sorted.
+        """
+        # validate_search_results already checked the payload shapes, so build the
+        # results without running the Entry and SearchResult validators per hit
+        return [
+            SearchResult.model_construct(
+                content=result.payload["document"].strip(),
+                score=result.score if include_score else 1.0,
+                metadata=result.payload.get("metadata"),
+                collection_name=collection_name,
+                vector_name=vector_name,
+                point_id=str(result.id),  # Capture point ID for updates
+            )
+            for result in validate_search_results(points)
+            if result.score >= score_threshold
+        ]
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        collection_name: Optional[str] = None,
+        limit: int = 10,
+        score_threshold: float = 0.0,
+    ) -> List[List[SearchResult]]:
+        """
+        Run several searches against one collection in a single Qdrant request.
+
+        Args:
+            queries: Search query strings
+            collection_name: Target collection (uses default if None)
+            limit: Maximum results to return per query
+            score_threshold: Minimum relevance score
+
+        Returns:
+            One list of SearchResult objects per query, in query order
+        """
+        collection_name = collection_name or self._default_collection_name
+        if not collection_name:
+            raise ValueError("Collection name must be specified")
+
+        return await self._search_batch_requests(
+            collection_name,
+            [(sanitize_query(query), limit, score_threshold) for query in queries],
+        )
+
+    async def _search_batch_requests(
+        self, collection_name: str, requests: List[Tuple[str, int, float]]
+    ) -> List[List[SearchResult]]:
+        """Embed (query, limit, score_threshold) requests and search them in one call."""
+        if not requests:
+            return []
+
+        if not await self._collection_exists(collection_name):
+            return [[] for _ in requests]
+
+        self._embedding_provider.set_collection_context(collection_name)
+        query_vectors = await asyncio.gather(
+            *(
+                self._embedding_provider.embed_query(query, collection_name)
+                for query, _, _ in requests
+            )
+        )
+        vector_name = self._embedding_provider.get_vector_name(collection_name)
+        search_params = self._search_params(collection_name)
+
+        try:
+            responses = await self._client.query_batch_points(
+                collection_name=collection_name,
+                requests=[
+                    models.QueryRequest(
+                        query=query_vector,
+                        using=vector_name,
+                        limit=limit,
+                        params=search_params,
+                        with_payload=True,
+                        with_vector=False,
+                    )
+                    for query_vector, (_, limit, _) in zip(query_vectors, requests)
+                ],
+            )
+        except Exception:
+            # The collection may have been dropped since it was last checked
+            self._known_collections.pop(collection_name, None)
+            raise
+
+        return [
+            self._to_search_results(
+                response.points,
+                collection_name=collection_name,
+                vector_name=vector_name,
+                score_threshold=score_threshold,
+            )[:limit]
+            for response, (_, limit, score_threshold) in zip(responses, requests)
+        ]
+
+    async def search_coalesced(
+        self,
+        query: str,
+        collection_name: Optional[str] = None,
+        limit: int = 10,
+        score_threshold: float = 0.0,
+    ) -> List[SearchResult]:
+        """
+        Search like `search`, sharing one Qdrant request with concurrent callers.
+
+        Searches on the same collection that arrive within a few milliseconds of
+        each other are sent together as a batch request, and near-duplicates of a
+        recent query are answered from the semantic cache when it is enabled.
+
+        Args:
+            query: Search query string
+            collection_name: Target collection (uses default if None)
+            limit: Maximum results to return
+            score_threshold: Minimum relevance score
+
+        Returns:
+            List of SearchResult objects with scores and metadata
+        """
+        query = sanitize_query(query)
+
+        collection_name = collection_name or self._default_collection_name
+        if not collection_name:
+            raise ValueError("Collection name must be specified")
+
+        params = (limit, score_threshold)
+        if self._semantic_cache is not None:
+            generation = self._semantic_cache.generation(collection_name)
+            # Query embeddings are cached by the provider, so search() reuses this one
+            query_vector = await self._embedding_provider.embed_query(
+                query, collection_name
+            )
+            cached = self._semantic_cache.get(collection_name, params, query_vector)
+            if cached is not None:
+                return list(cached)
+
+        # Retry outside the shared worker so backoff never delays other searches
+        for attempt in range(SEARCH_MAX_RETRIES):
+            future: "asyncio.Future[List[SearchResult]]" = (
+                asyncio.get_running_loop().create_future()
+            )
+            self._get_search_queue(collection_name).put_nowait(
+                (query, limit, score_threshold, future)
+            )
+            try:
+                results = await future
+                break
+            except Exception as e:
+                if attempt == SEARCH_MAX_RETRIES - 1:
+                    logger.error(
+                        f"Search failed for query '{query}' in collection '{collection_name}': {e}"
+                    )
+                    raise
+                wait_time = 2**attempt
+                logger.warning(
+                    f"Search attempt {attempt + 1} failed, retrying in {wait_time}s: {e}"
+                )
+                await asyncio.sleep(wait_time)
+
+        if self._semantic_cache is not None:
+            self._semantic_cache.put(
+                collection_name, params, query_vector, results, generation
+            )
+        return results
+
+    def _get_search_queue(self, collection_name: str) -> "asyncio.Queue[PendingSearch]":
+        """Get the batching queue for a collection, starting its worker if needed."""
+        loop = asyncio.get_running_loop()
+        worker = self._search_workers.get(collection_name)
+
+        # Queues are bound to the loop that created them; rebuild on a new loop
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            queue: "asyncio.Queue[PendingSearch]" = asyncio.Queue()
+            self._search_queues[collection_name] = queue
+            self._search_workers[collection_name] = loop.create_task(
+                self._run_search_worker(collection_name, queue)
+            )
+
+        return self._search_queues[collection_name]
+
+    async def _run_search_worker(
+        self, collection_name: str, queue: "asyncio.Queue[PendingSearch]"
+    ) -> None:
+        """Drain queued searches in batches and resolve their futures."""
+        while True:
+            try:
+                pending = [
+                    await asyncio.wait_for(
+                        queue.get(), timeout=SEARCH_WORKER_IDLE_SECONDS
+                    )
+                ]
+            except asyncio.TimeoutError:
+                # Nothing can be queued between this check and returning, since
+                # callers put items without awaiting
+                if not queue.empty():
+                    continue
+                if self._search_queues.get(collection_name) is queue:
+                    del self._search_queues[collection_name]
+                    del self._search_workers[collection_name]
+                return
+
+            # Gather more searches until the batch is full or the window closes
+            while len(pending) < SEARCH_BATCH_MAX:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), timeout=SEARCH_BATCH_WINDOW_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+
+            try:
+                # No retries here: callers retry on their own, so a failing
+                # request never holds up the searches queued behind it
+                results = await self._search_batch_requests(
+                    collection_name,
+                    [
+                        (query, limit, threshold)
+                        for query, limit, threshold, _ in pending
+                    ],
+                )
+            except Exception as e:
+                for *_, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (*_, future), result in zip(pending, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def _search_params(self, collection_name: str) -> Optional[models.SearchParams]:
+        """
+        Get the search parameters for a collection's quantization.
+
+        Binary-quantized collections are searched on their 1-bit vectors with
+        oversampling, then the candidates are rescored with the original vectors.
+        """
+        if not self._qdrant_settings.enable_quantization or (
+            self._embedding_provider.get_vector_size(collection_name)
+            < BINARY_QUANTIZATION_MIN_DIMENSIONS
+        ):
+            return None
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                ignore=False,
+                rescore=True,
+                oversampling=BINARY_QUANTIZATION_OVERSAMPLING,
+            )
+        )
+
     async def _search_with_retry(
         self,
         collection_name: str,
@@ -389,6 +914,7 @@ class EnhancedQdrantConnector:
         max_retries: int = 3,
     ) -> Any:
         """Execute search with exponential backoff retry."""
+        search_params = self._search_params(collection_name)
 
         for attempt in range(max_retries):
             try:
@@ -397,6 +923,7 @@ class EnhancedQdrantConnector:
                     query=query_vector,
                     using=vector_name,
                     limit=limit,
+                    search_params=search_params,
                     with_payload=True,
                     with_vectors=False,
                 )
@@ -433,11 +960,50 @@ class EnhancedQdrantConnector:
                 )
                 await asyncio.sleep(wait_time)
 
+    @asynccontextmanager
+    async def _indexing_paused(self, collection_name: str) -> AsyncIterator[None]:
+        """
+        Disable HNSW indexing on a collection, restoring its threshold afterwards.
+
+        Overlapping pauses on one collection are counted and the threshold is only
+        restored when the last one exits. A threshold of 0 read at the start (left
+        behind by an interrupted ingest) is restored as INDEXING_THRESHOLD instead.
+        """
+        count = self._indexing_pause_counts.get(collection_name, 0)
+        # Counted before any await so an overlapping call sees this pause
+        self._indexing_pause_counts[collection_name] = count + 1
+        try:
+            if not count:
+                info = await self._client.get_collection(collection_name)
+                threshold = info.config.optimizer_config.indexing_threshold
+                self._indexing_restore_thresholds[collection_name] = (
+                    threshold or INDEXING_THRESHOLD
+                )
+                await self._client.update_collection(
+                    collection_name=collection_name,
+                    optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0),
+                )
+            yield
+        finally:
+            remaining = self._indexing_pause_counts[collection_name] - 1
+            if remaining:
+                self._indexing_pause_counts[collection_name] = remaining
+            else:
+                del self._indexing_pause_counts[collection_name]
+                threshold = self._indexing_restore_thresholds.pop(collection_name, None)
+                if threshold is not None:
+                    await self._client.update_collection(
+                        collection_name=collection_name,
+                        optimizers_config=models.OptimizersConfigDiff(
+                            indexing_threshold=threshold
+                        ),
+                    )
+
     async def _ensure_collection_exists(self, collection_name: str):
         """
         Ensure collection exists with optimal configuration for its purpose.
         """
-        collection_exists = await self._client.collection_exists(collection_name)
+        collection_exists = await self._collection_exists(collection_name)
         if not collection_exists and self._qdrant_settings.auto_create_collections:
             # Get collection-specific configuration
             vector_size = self._embedding_provider.get_vector_size(collection_name)
@@ -446,12 +1012,12 @@ class EnhancedQdrantConnector:
             # Determine quantization based on vector size and settings
             quantization_config = None
             if self._qdrant_settings.enable_quantization:
-                if vector_size >= 1024:
+                if vector_size >= BINARY_QUANTIZATION_MIN_DIMENSIONS:
                     # Use binary quantization for large vectors (32x compression)
                     quantization_config = models.BinaryQuantization(
                         binary=models.BinaryQuantizationConfig(always_ram=True)
                     )
-                elif vector_size >= 512:
+                elif vector_size >= SCALAR_QUANTIZATION_MIN_DIMENSIONS:
                     # Use scalar quantization for medium vectors (4x compression)
                     quantization_config = models.ScalarQuantization(
                         scalar=models.ScalarQuantizationConfig(
@@ -493,11 +1059,11 @@ class EnhancedQdrantConnector:
                 },
                 quantization_config=quantization_config,
                 optimizers_config=models.OptimizersConfigDiff(
-                    indexing_threshold=10000,  # Lower threshold for faster indexing
+                    indexing_threshold=INDEXING_THRESHOLD,  # Lower threshold for faster indexing
                 ),
             )
 
-            # print(f"[DEBUG] enhanced_qdrant.py: Collection {collection_name} created successfully", file=sys.stderr)
+            self._known_collections[collection_name] = time.monotonic()
 
     async def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
         """Get detailed information about a collection."""
@@ -525,13 +1091,15 @@ class EnhancedQdrantConnector:
     async def list_collections_with_info(self) -> list[Dict[str, Any]]:
         """List all collections with their detailed information."""
         collection_names = await self.get_collection_names()
-        collections_info = []
+        semaphore = asyncio.Semaphore(COLLECTION_INFO_CONCURRENCY)
 
-        for name in collection_names:
-            info = await self.get_collection_info(name)
-            collections_info.append(info)
+        async def limited_info(name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_collection_info(name)
 
-        return collections_info
+        # Fetch collections concurrently; get_collection_info reports its own
+        # errors, so one failing collection doesn't fail the listing
+        return list(await asyncio.gather(*map(limited_info, collection_names)))
 
     async def get_point(self, point_id: str, collection_name: str) -> Dict[str, Any]:
         """Retrieve a single point by ID.
@@ -594,6 +1162,7 @@ class EnhancedQdrantConnector:
                 key=key,
                 wait=True,
             )
+            self._invalidate_search_cache(collection_name)
             return {
                 "success": True,
                 "updated_count": len(point_ids),
@@ -638,9 +1207,15 @@ class EnhancedQdrantConnector:
                     "collection_name": collection_name,
                 }
 
-            await self._client.delete(
-                collection_name=collection_name, points_selector=point_ids, wait=True
-            )
+            # Split large deletions into fixed-size requests. Qdrant applies updates
+            # in order, so waiting on the last chunk covers the earlier ones.
+            for start in range(0, len(point_ids), DELETE_BATCH_SIZE):
+                await self._client.delete(
+                    collection_name=collection_name,
+                    points_selector=point_ids[start : start + DELETE_BATCH_SIZE],
+                    wait=start + DELETE_BATCH_SIZE >= len(point_ids),
+                )
+            self._invalidate_search_cache(collection_name)
 
             return {
                 "success": True,
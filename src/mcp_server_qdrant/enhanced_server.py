@@ -2,7 +2,9 @@
 Enhanced server entry point with collection-specific embedding models.
 """
 
-import sys
+from functools import lru_cache
+from typing import Any
+
 from mcp_server_qdrant.mcp_server import QdrantMCPServer
 from mcp_server_qdrant.enhanced_settings import (
     EnhancedEmbeddingProviderSettings,
@@ -11,22 +13,18 @@ from mcp_server_qdrant.enhanced_settings import (
 from mcp_server_qdrant.settings import ToolSettings
 from mcp.server.transport_security import TransportSecuritySettings
 
-# print("[DEBUG] enhanced_server.py: Initializing enhanced settings", file=sys.stderr)
 
-try:
-    tool_settings = ToolSettings()
-    # print(f"[DEBUG] enhanced_server.py: ToolSettings initialized", file=sys.stderr)
+@lru_cache(maxsize=None)
+def get_mcp() -> QdrantMCPServer:
+    """
+    Build the enhanced server on first use and return the same instance afterwards.
 
+    Settings are read from the environment, so importing this module stays cheap
+    and a preloading parent process can create the server once for its workers.
+    """
+    tool_settings = ToolSettings()
     qdrant_settings = EnhancedQdrantSettings()
-    # print(f"[DEBUG] enhanced_server.py: EnhancedQdrantSettings initialized:", file=sys.stderr)
-    # print(f"[DEBUG] enhanced_server.py:   location={qdrant_settings.location}", file=sys.stderr)
-    # print(f"[DEBUG] enhanced_server.py:   auto_create_collections={qdrant_settings.auto_create_collections}", file=sys.stderr)
-    # print(f"[DEBUG] enhanced_server.py:   enable_quantization={qdrant_settings.enable_quantization}", file=sys.stderr)
-
     embedding_settings = EnhancedEmbeddingProviderSettings()
-    # print(f"[DEBUG] enhanced_server.py: EnhancedEmbeddingProviderSettings initialized:", file=sys.stderr)
-    # print(f"[DEBUG] enhanced_server.py:   provider_type={embedding_settings.provider_type}", file=sys.stderr)
-    # print(f"[DEBUG] enhanced_server.py:   model_name={embedding_settings.model_name}", file=sys.stderr)
 
     # Configure transport security to allow IP-based access
     transport_security = TransportSecuritySettings(
@@ -48,18 +46,16 @@ try:
         ],
     )
 
-    # print("[DEBUG] enhanced_server.py: Creating EnhancedQdrantMCPServer instance", file=sys.stderr)
-    mcp = QdrantMCPServer(
+    return QdrantMCPServer(
         tool_settings=tool_settings,
         qdrant_settings=qdrant_settings,
         embedding_provider_settings=embedding_settings,
         transport_security=transport_security,
     )
-    # print("[DEBUG] enhanced_server.py: EnhancedQdrantMCPServer instance created successfully", file=sys.stderr)
 
-except Exception:
-    # print(f"[ERROR] enhanced_server.py: Failed to initialize enhanced server: {type(e).__name__}: {e}", file=sys.stderr)
-    import traceback
 
-    traceback.print_exc(file=sys.stderr)
-    raise
+def __getattr__(name: str) -> Any:
+    # Keep `from mcp_server_qdrant.enhanced_server import mcp` working
+    if name == "mcp":
+        return get_mcp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
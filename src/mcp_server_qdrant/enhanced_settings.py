@@ -2,41 +2,48 @@
 Enhanced settings that support multiple embedding models and vector dimensions.
 """
 
-from typing import Dict, Optional, Union
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings
+from functools import cached_property
+from typing import Dict, List, NamedTuple, Optional
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from mcp_server_qdrant.embeddings.types import EmbeddingProviderType
 
+
+class ModelConfig(NamedTuple):
+    """Embedding model configuration for the collections mapped to it."""
+
+    dimensions: int
+    vector_name: str
+    fastembed_model: str
+    provider: EmbeddingProviderType = EmbeddingProviderType.FASTEMBED
+
+
 # Predefined embedding model configurations based on actual FastEmbed models
-EMBEDDING_MODEL_CONFIGS = {
+EMBEDDING_MODEL_CONFIGS: Dict[str, ModelConfig] = {
     # Legal analysis - high complexity (using largest available model)
-    "bge-large-en-v1.5": {
-        "dimensions": 1024,
-        "vector_name": "bge-large-en-v1.5",
-        "provider": EmbeddingProviderType.FASTEMBED,
-        "fastembed_model": "BAAI/bge-large-en-v1.5",
-    },
+    "bge-large-en-v1.5": ModelConfig(
+        dimensions=1024,
+        vector_name="bge-large-en-v1.5",
+        fastembed_model="BAAI/bge-large-en-v1.5",
+    ),
     # Workplace documentation - medium complexity
-    "bge-base-en-v1.5": {
-        "dimensions": 768,
-        "vector_name": "bge-base-en-v1.5",
-        "provider": EmbeddingProviderType.FASTEMBED,
-        "fastembed_model": "BAAI/bge-base-en-v1.5",
-    },
+    "bge-base-en-v1.5": ModelConfig(
+        dimensions=768,
+        vector_name="bge-base-en-v1.5",
+        fastembed_model="BAAI/bge-base-en-v1.5",
+    ),
     # Comprehensive analysis - medium-high complexity
-    "bge-base-en": {
-        "dimensions": 768,
-        "vector_name": "bge-base-en",
-        "provider": EmbeddingProviderType.FASTEMBED,
-        "fastembed_model": "BAAI/bge-base-en",
-    },
+    "bge-base-en": ModelConfig(
+        dimensions=768,
+        vector_name="bge-base-en",
+        fastembed_model="BAAI/bge-base-en",
+    ),
     # Technical solutions - standard (384D MiniLM for efficiency)
-    "all-minilm-l6-v2": {
-        "dimensions": 384,
-        "vector_name": "all-minilm-l6-v2",
-        "provider": EmbeddingProviderType.FASTEMBED,
-        "fastembed_model": "sentence-transformers/all-MiniLM-L6-v2",
-    },
+    "all-minilm-l6-v2": ModelConfig(
+        dimensions=384,
+        vector_name="all-minilm-l6-v2",
+        fastembed_model="sentence-transformers/all-MiniLM-L6-v2",
+    ),
 }
 
 # Collection-specific embedding model mappings - CORRECTED with proper high-dimension models
@@ -92,6 +99,9 @@ class EnhancedEmbeddingProviderSettings(BaseSettings):
     Enhanced configuration for embedding providers with multi-model support.
     """
 
+    # Frozen so the parsed mappings cached below can't go stale
+    model_config = SettingsConfigDict(frozen=True)
+
     provider_type: EmbeddingProviderType = Field(
         default=EmbeddingProviderType.FASTEMBED,
         validation_alias="EMBEDDING_PROVIDER",
@@ -103,97 +113,103 @@ class EnhancedEmbeddingProviderSettings(BaseSettings):
         validation_alias="EMBEDDING_MODEL",
     )
 
-    # Collection-specific model mappings (JSON string)
-    collection_model_mappings: str = Field(
-        default="{}",
+    # Collection-specific model mappings (JSON object in the environment)
+    collection_model_mappings: Dict[str, str] = Field(
+        default_factory=dict,
         validation_alias="COLLECTION_MODEL_MAPPINGS",
     )
 
-    # Custom model configurations (JSON string)
-    custom_model_configs: str = Field(
-        default="{}",
+    # Custom model configurations (JSON object in the environment)
+    custom_model_configs: Dict[str, ModelConfig] = Field(
+        default_factory=dict,
         validation_alias="CUSTOM_MODEL_CONFIGS",
     )
 
-    @field_validator("collection_model_mappings", "custom_model_configs")
-    @classmethod
-    def parse_json_fields(cls, v: str) -> str:
-        """Validate that JSON fields are properly formatted."""
-        if v and v != "{}":
-            import json
-
-            try:
-                json.loads(v)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON format: {e}")
-        return v
-
-    def get_model_config_for_collection(
-        self, collection_name: str
-    ) -> Dict[str, Union[str, int]]:
-        """
-        Get the embedding model configuration for a specific collection.
+    # Load every mapped model at server startup instead of on first use. Off by
+    # default: startup then waits for every model to load (and download on a fresh
+    # machine), which can outlast a client's initialize timeout
+    preload_models: bool = Field(
+        default=False,
+        validation_alias="EMBEDDING_PRELOAD_MODELS",
+    )
 
-        :param collection_name: Name of the collection
-        :return: Model configuration dict with dimensions, vector_name, etc.
+    @cached_property
+    def _all_collection_mappings(self) -> Dict[str, str]:
         """
-        import json
+        Built-in collection mappings with the COLLECTION_MODEL_MAPPINGS overrides applied.
 
-        # Resolve collection name through aliases for backward compatibility
-        resolved_collection_name = COLLECTION_ALIASES.get(
-            collection_name, collection_name
-        )
+        Aliases are folded in and take their target's model, so one lookup resolves
+        both alias and canonical names.
+        """
+        mappings = {**COLLECTION_MODEL_MAPPINGS, **self.collection_model_mappings}
+        for alias, target in COLLECTION_ALIASES.items():
+            if target in mappings:
+                mappings[alias] = mappings[target]
+        return mappings
 
-        # Parse collection mappings from settings
-        collection_mappings = {}
-        if self.collection_model_mappings and self.collection_model_mappings != "{}":
-            collection_mappings = json.loads(self.collection_model_mappings)
+    @cached_property
+    def _all_model_configs(self) -> Dict[str, ModelConfig]:
+        """Built-in model configurations with the CUSTOM_MODEL_CONFIGS overrides applied."""
+        return {**EMBEDDING_MODEL_CONFIGS, **self.custom_model_configs}
 
-        # Merge with default mappings
-        all_mappings = {**COLLECTION_MODEL_MAPPINGS, **collection_mappings}
+    @cached_property
+    def _model_config_cache(self) -> Dict[str, ModelConfig]:
+        """Resolved model configuration per collection name, filled on first use."""
+        return {}
 
-        # Parse custom configs from settings
-        custom_configs = {}
-        if self.custom_model_configs and self.custom_model_configs != "{}":
-            custom_configs = json.loads(self.custom_model_configs)
+    def get_model_config_for_collection(self, collection_name: str) -> ModelConfig:
+        """
+        Get the embedding model configuration for a specific collection.
 
-        # Merge with default configs
-        all_configs = {**EMBEDDING_MODEL_CONFIGS, **custom_configs}
+        :param collection_name: Name of the collection
+        :return: Model configuration with dimensions, vector_name, etc.
+        """
+        config = self._model_config_cache.get(collection_name)
+        if config is not None:
+            return config
 
-        # Find model for collection (try both original and resolved names)
-        model_name = all_mappings.get(resolved_collection_name) or all_mappings.get(
-            collection_name
-        )
+        # Aliases are already folded into the mappings
+        model_name = self._all_collection_mappings.get(collection_name)
         if not model_name:
             # Fall back to default model
-            return {
-                "dimensions": 384,
-                "vector_name": "all-minilm-l6-v2",
-                "provider": EmbeddingProviderType.FASTEMBED,
-                "fastembed_model": self.model_name,
-            }
-
-        # Get config for model
-        config = all_configs.get(model_name)
-        if not config:
-            raise ValueError(f"No configuration found for model: {model_name}")
+            config = ModelConfig(
+                dimensions=384,
+                vector_name="all-minilm-l6-v2",
+                fastembed_model=self.model_name,
+            )
+        else:
+            # Get config for model
+            config = self._all_model_configs.get(model_name)
+            if not config:
+                raise ValueError(f"No configuration found for model: {model_name}")
 
+        self._model_config_cache[collection_name] = config
         return config
 
+    def list_all_fastembed_models(self) -> List[str]:
+        """
+        List the distinct FastEmbed models used by the default model and all mapped collections.
+
+        :return: FastEmbed model names, default model first
+        """
+        fastembed_models = [self.model_name]
+        for collection_name in sorted(self._all_collection_mappings):
+            fastembed_model = self.get_fastembed_model_for_collection(collection_name)
+            if fastembed_model not in fastembed_models:
+                fastembed_models.append(fastembed_model)
+        return fastembed_models
+
     def get_fastembed_model_for_collection(self, collection_name: str) -> str:
         """Get the FastEmbed model name for a collection."""
-        config = self.get_model_config_for_collection(collection_name)
-        return config.get("fastembed_model", self.model_name)
+        return self.get_model_config_for_collection(collection_name).fastembed_model
 
     def get_vector_name_for_collection(self, collection_name: str) -> str:
         """Get the vector name for a collection."""
-        config = self.get_model_config_for_collection(collection_name)
-        return config.get("vector_name", "all-minilm-l6-v2")
+        return self.get_model_config_for_collection(collection_name).vector_name
 
     def get_dimensions_for_collection(self, collection_name: str) -> int:
         """Get the vector dimensions for a collection."""
-        config = self.get_model_config_for_collection(collection_name)
-        return config.get("dimensions", 384)
+        return self.get_model_config_for_collection(collection_name).dimensions
 
 
 class EnhancedQdrantSettings(BaseSettings):
@@ -212,6 +228,10 @@ class EnhancedQdrantSettings(BaseSettings):
     search_limit: int = Field(default=10, validation_alias="QDRANT_SEARCH_LIMIT")
     read_only: bool = Field(default=False, validation_alias="QDRANT_READ_ONLY")
 
+    # Enhanced: gRPC sends vectors as packed floats instead of JSON arrays
+    prefer_grpc: bool = Field(default=False, validation_alias="QDRANT_PREFER_GRPC")
+    grpc_port: int = Field(default=6334, validation_alias="QDRANT_GRPC_PORT")
+
     # Enhanced: Auto-create collections with optimal configurations
     auto_create_collections: bool = Field(
         default=True, validation_alias="QDRANT_AUTO_CREATE_COLLECTIONS"
@@ -227,3 +247,24 @@ class EnhancedQdrantSettings(BaseSettings):
         default=200, validation_alias="QDRANT_HNSW_EF_CONSTRUCT"
     )
     hnsw_m: int = Field(default=16, validation_alias="QDRANT_HNSW_M")
+
+    # Enhanced: Serve near-duplicate searches from an in-process semantic cache.
+    # Opt-in: a hit returns the results of an earlier, similar but possibly different
+    # query, and writes from other processes only show up once entries expire
+    semantic_cache_enabled: bool = Field(
+        default=False, validation_alias="QDRANT_SEMANTIC_CACHE"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95, validation_alias="QDRANT_SEMANTIC_CACHE_THRESHOLD"
+    )
+    semantic_cache_size: int = Field(
+        default=1000, validation_alias="QDRANT_SEMANTIC_CACHE_SIZE"
+    )
+    semantic_cache_ttl: float = Field(
+        default=60.0, validation_alias="QDRANT_SEMANTIC_CACHE_TTL"
+    )
+
+    # Enhanced: Upsert requests bulk_store keeps in flight while embedding continues
+    bulk_upsert_concurrency: int = Field(
+        default=4, validation_alias="QDRANT_BULK_UPSERT_CONCURRENCY"
+    )
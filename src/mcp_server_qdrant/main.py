@@ -1,6 +1,7 @@
-import argparse
 import sys
 
+DEFAULT_TRANSPORT = "stdio"
+
 
 def main():
     """
@@ -16,15 +17,21 @@ def main():
     #     if key.startswith(('QDRANT', 'EMBEDDING', 'COLLECTION', 'TOOL')):
     #         print(f"[DEBUG] main.py:   {key}={value}", file=sys.stderr)
 
-    # Parse the command-line arguments to determine the transport protocol.
-    parser = argparse.ArgumentParser(description="mcp-server-qdrant")
-    parser.add_argument(
-        "--transport",
-        choices=["stdio", "sse"],
-        default="stdio",
-    )
-    args = parser.parse_args()
-    # print(f"[DEBUG] main.py: Transport mode: {args.transport}", file=sys.stderr)
+    # MCP clients usually spawn the server without arguments; skip argparse then
+    if len(sys.argv) > 1:
+        import argparse
+
+        # Parse the command-line arguments to determine the transport protocol.
+        parser = argparse.ArgumentParser(description="mcp-server-qdrant")
+        parser.add_argument(
+            "--transport",
+            choices=["stdio", "sse"],
+            default=DEFAULT_TRANSPORT,
+        )
+        transport = parser.parse_args().transport
+    else:
+        transport = DEFAULT_TRANSPORT
+    # print(f"[DEBUG] main.py: Transport mode: {transport}", file=sys.stderr)
 
     try:
         # Import is done here to make sure environment variables are loaded
@@ -33,8 +40,8 @@ def main():
         from mcp_server_qdrant.server import mcp
         # print(f"[DEBUG] main.py: Server module imported successfully", file=sys.stderr)
 
-        # print(f"[DEBUG] main.py: Starting MCP server with transport={args.transport}", file=sys.stderr)
-        mcp.run(transport=args.transport)
+        # print(f"[DEBUG] main.py: Starting MCP server with transport={transport}", file=sys.stderr)
+        mcp.run(transport=transport)
     except Exception:
         #         print(f"[ERROR] main.py: Exception occurred: {type(e).__name__}: {e}", file=sys.stderr)
         import traceback
@@ -2,28 +2,192 @@
 Enhanced MCP server with collection-specific embedding models and optimized configurations.
 """
 
-import json
+import asyncio
 import logging
-from datetime import datetime
-from typing import Any, List, Dict, Annotated, Optional
+import time
+from collections import ChainMap, defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, List, Dict, Annotated, Final, Optional, Tuple
+from xml.sax.saxutils import escape
 from pydantic import Field
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.types import ToolAnnotations
 from mcp_server_qdrant.enhanced_qdrant import Entry, Metadata, EnhancedQdrantConnector
 from mcp_server_qdrant.enhanced_settings import (
+    COLLECTION_MODEL_MAPPINGS,
+    EMBEDDING_MODEL_CONFIGS,
     EnhancedEmbeddingProviderSettings,
     EnhancedQdrantSettings,
 )
 from mcp_server_qdrant.settings import ToolSettings
+from mcp_server_qdrant.validators import encode_metadata
 
 logger = logging.getLogger(__name__)
 
+# How long admin tool output (collection listings and details) is reused
+ADMIN_CACHE_TTL_SECONDS = 2.0
+
+# Tool metadata, keyed by the name of the tool function
+_TOOL_DESCRIPTIONS: Final[Dict[str, str]] = {
+    "qdrant_store": "Store information in Qdrant with automatic collection-specific embedding model selection.",
+    "qdrant_bulk_store": "Store multiple documents efficiently in Qdrant with collection-specific embedding models and batch processing.",
+    "qdrant_find": "Search for information in Qdrant using collection-specific embedding model with structured results.",
+    "qdrant_list_collections": "List all Qdrant collections with their configurations and model information.",
+    "qdrant_collection_info": "Get detailed information about a specific Qdrant collection.",
+    "qdrant_model_mappings": "Show current collection-to-model mappings and available configurations.",
+    "qdrant_get_point": "Retrieve a single point by ID for inspection or verification after updates.",
+    "qdrant_update_payload": "Update payload fields on existing points without re-embedding (10-100x faster than re-storing). Uses merge semantics. IMPORTANT: Qdrant payloads have nested structure (payload.document + payload.metadata). Use key='metadata' to update metadata fields like sync_status, synced_to_asana. Without key parameter, updates write to root payload level instead of nested metadata.",
+    "qdrant_delete_points": "Delete points from a Qdrant collection by their IDs. WARNING: PERMANENT operation - cannot be undone. Get point_ids from qdrant_find search results.",
+}
+
+_TOOL_ANNOTATIONS: Final[Dict[str, ToolAnnotations]] = {
+    "qdrant_store": ToolAnnotations(
+        readOnlyHint=False,  # Modifies database
+        destructiveHint=False,  # Creates, doesn't destroy
+        idempotentHint=True,  # Same content → same embedding
+        openWorldHint=False,  # Local Qdrant instance
+    ),
+    "qdrant_bulk_store": ToolAnnotations(
+        readOnlyHint=False,  # Modifies database
+        destructiveHint=False,  # Creates, doesn't destroy
+        idempotentHint=True,  # Same documents → same embeddings
+        openWorldHint=False,  # Local Qdrant instance
+    ),
+    "qdrant_find": ToolAnnotations(
+        readOnlyHint=True,  # Only reads data
+        destructiveHint=False,  # No modifications
+        idempotentHint=True,  # Same query → same results
+        openWorldHint=False,  # Local Qdrant instance
+    ),
+    "qdrant_list_collections": ToolAnnotations(
+        readOnlyHint=True,  # Only reads metadata
+        destructiveHint=False,  # No modifications
+        idempotentHint=True,  # Consistent listing
+        openWorldHint=False,  # Local Qdrant instance
+    ),
+    "qdrant_collection_info": ToolAnnotations(
+        readOnlyHint=True,  # Only reads metadata
+        destructiveHint=False,  # No modifications
+        idempotentHint=True,  # Consistent info
+        openWorldHint=False,  # Local Qdrant instance
+    ),
+    "qdrant_model_mappings": ToolAnnotations(
+        readOnlyHint=True,  # Only reads config
+        destructiveHint=False,  # No modifications
+        idempotentHint=True,  # Static configuration
+        openWorldHint=False,  # In-memory config
+    ),
+    "qdrant_get_point": ToolAnnotations(
+        readOnlyHint=True,  # Only reads data
+        destructiveHint=False,  # No modifications
+        idempotentHint=True,  # Same ID → same result
+        openWorldHint=False,  # Local Qdrant instance
+    ),
+    "qdrant_update_payload": ToolAnnotations(
+        readOnlyHint=False,  # Modifies database
+        destructiveHint=False,  # Merges, doesn't destroy
+        idempotentHint=True,  # Same update → same result
+        openWorldHint=False,  # Local Qdrant instance
+    ),
+    "qdrant_delete_points": ToolAnnotations(
+        readOnlyHint=False,  # Modifies database
+        destructiveHint=True,  # PERMANENT deletion
+        idempotentHint=True,  # Deleting same IDs twice is safe
+        openWorldHint=False,  # Local Qdrant instance
+    ),
+}
+
+
+# Longest stretch of stored content echoed back by qdrant_store
+_STORE_PREVIEW_CHARS: Final[int] = 200
+
+# Message returned by qdrant_find when nothing matches
+_NO_RESULTS_TEMPLATE: Final[str] = (
+    "No information found for query '{}' in collection {}"
+)
+
+# Precompiled output templates for the admin tools
+_COLLECTIONS_HEADER: Final[str] = "Qdrant Collections:\n\n"
+_MODEL_MAPPINGS_HEADER: Final[str] = "📋 **Collection Model Mappings:**\n\n"
+_MODEL_CONFIGS_HEADER: Final[str] = "📚 **Available Model Configs:**\n\n"
+_COLLECTION_ROW_TEMPLATE: Final[str] = (
+    "📊 **{collection_name}**\n"
+    "   Status: {status}\n"
+    "   Points: {points_count}\n"
+    "   Vector: {vector_name} ({dimensions}D)\n"
+    "   Model: {fastembed_model}\n\n"
+)
+_COLLECTION_ERROR_TEMPLATE: Final[str] = "❌ {name}: Error - {error}\n"
+# Fallback for row fields missing from a collection's info
+_COLLECTION_ROW_DEFAULTS: Final[Dict[str, Any]] = defaultdict(
+    lambda: "unknown", points_count=0
+)
+_COLLECTION_INFO_TEMPLATE: Final[str] = (
+    "🔍 **Collection: {name}**\n\n"
+    "**Status:** {status}\n"
+    "**Points:** {points}\n"
+    "**Indexed Vectors:** {indexed_vectors}\n\n"
+    "**Vector Configuration:**\n"
+    "   Vector Name: {vector_name}\n"
+    "   Dimensions: {dimensions}\n"
+    "   FastEmbed Model: {fastembed_model}\n\n"
+    "**Optimizations:**\n"
+    "   Quantization: {quantization}\n"
+)
+_MODEL_MAPPING_TEMPLATE: Final[str] = (
+    "**{collection}**\n"
+    "   Model: {model}\n"
+    "   Dimensions: {dimensions}\n"
+    "   FastEmbed: {fastembed_model}\n\n"
+)
+_MODEL_CONFIG_TEMPLATE: Final[str] = "**{model}**: {dimensions}D ({fastembed_model})\n"
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as an ISO 8601 string for tool responses."""
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _build_entries(
+    documents: List[str], metadata_list: Optional[List[Metadata]]
+) -> List[Entry]:
+    """
+    Validate documents and their metadata into entries.
+
+    Run through asyncio.to_thread: the Entry validators serialize every metadata
+    object, which would otherwise stall the event loop for large batches.
+
+    :param documents: Documents to store.
+    :param metadata_list: Metadata for each document, or None.
+    :return: One entry per document.
+    """
+    if not metadata_list:
+        return [Entry(content=document) for document in documents]
+    return [
+        Entry(content=document, metadata=metadata)
+        for document, metadata in zip(documents, metadata_list)
+    ]
+
 
 class QdrantMCPServer(FastMCP):
     """
     Enhanced MCP server for Qdrant with collection-specific embedding models.
     """
 
+    # FastMCP keeps an instance __dict__, so these only turn our own attributes
+    # into fixed-offset descriptors for the attribute reads on every tool call
+    __slots__ = (
+        "tool_settings",
+        "qdrant_settings",
+        "embedding_provider_settings",
+        "qdrant_connector",
+        "_model_info_cache",
+        "_admin_cache",
+        "_debug_enabled",
+        "_model_mappings_output",
+    )
+
     def __init__(
         self,
         tool_settings: ToolSettings,
@@ -33,48 +197,129 @@ class QdrantMCPServer(FastMCP):
         instructions: str | None = None,
         **settings: Any,
     ):
-        # print(f"[DEBUG] enhanced_mcp_server.py: EnhancedQdrantMCPServer.__init__ called", file=sys.stderr)
-
         self.tool_settings = tool_settings
         self.qdrant_settings = qdrant_settings
         self.embedding_provider_settings = embedding_provider_settings
+        self._model_info_cache: Dict[str, Tuple[str, Any]] = {}
+        self._admin_cache: Dict[str, Tuple[float, str]] = {}
+
+        self.qdrant_connector = EnhancedQdrantConnector(
+            qdrant_settings=qdrant_settings,
+            embedding_settings=embedding_provider_settings,
+            default_collection_name=qdrant_settings.collection_name,
+        )
+
+        settings.setdefault("lifespan", self._lifespan)
+
+        super().__init__(name=name, instructions=instructions, **settings)
+
+        # Client log notifications cost a transport frame per call; only send them
+        # when debugging (checked after FastMCP has configured logging)
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        try:
-            # print(f"[DEBUG] enhanced_mcp_server.py: Creating EnhancedQdrantConnector", file=sys.stderr)
-            self.qdrant_connector = EnhancedQdrantConnector(
-                qdrant_settings=qdrant_settings,
-                embedding_settings=embedding_provider_settings,
-                default_collection_name=qdrant_settings.collection_name,
+        # The mapping tables are fixed at import time, so render them once
+        self._model_mappings_output = self._render_model_mappings()
+
+        self.setup_tools()
+
+    @asynccontextmanager
+    async def _lifespan(self, server: FastMCP) -> AsyncIterator[None]:
+        """Warm up embedding models and the Qdrant connection before serving requests."""
+        warm_ups = [self.qdrant_connector.warm_up()]
+        if self.embedding_provider_settings.preload_models:
+            warm_ups.append(self.qdrant_connector._embedding_provider.warm_up())
+        await asyncio.gather(*warm_ups)
+        yield
+
+    def _cached_model_info(self, collection_name: str) -> Tuple[str, Any]:
+        """
+        Get the (vector name, dimensions) pair used to confirm stores into a collection.
+
+        The model for a collection is fixed by the settings, so the lookup is done once.
+
+        :param collection_name: Name of the collection.
+        :return: Vector name and dimensions of the collection's model.
+        """
+        model_info = self._model_info_cache.get(collection_name)
+        if model_info is None:
+            config = (
+                self.qdrant_connector._embedding_provider.get_model_info_for_collection(
+                    collection_name
+                )
+            )
+            model_info = (
+                config.get("vector_name") or "unknown",
+                config.get("dimensions") or "unknown",
             )
-            # print(f"[DEBUG] enhanced_mcp_server.py: EnhancedQdrantConnector created successfully", file=sys.stderr)
-        except Exception:
-            # print(f"[ERROR] enhanced_mcp_server.py: Failed to create EnhancedQdrantConnector: {type(e).__name__}: {e}", file=sys.stderr)
-            raise
-
-        try:
-            # print(f"[DEBUG] enhanced_mcp_server.py: Calling FastMCP.__init__", file=sys.stderr)
-            super().__init__(name=name, instructions=instructions, **settings)
-            # print(f"[DEBUG] enhanced_mcp_server.py: FastMCP.__init__ completed successfully", file=sys.stderr)
-        except Exception:
-            # print(f"[ERROR] enhanced_mcp_server.py: FastMCP.__init__ failed: {type(e).__name__}: {e}", file=sys.stderr)
-            raise
-
-        try:
-            # print(f"[DEBUG] enhanced_mcp_server.py: Setting up enhanced tools", file=sys.stderr)
-            self.setup_tools()
-            # print(f"[DEBUG] enhanced_mcp_server.py: Enhanced tools setup completed", file=sys.stderr)
-        except Exception:
-            # print(f"[ERROR] enhanced_mcp_server.py: setup_tools failed: {type(e).__name__}: {e}", file=sys.stderr)
-            raise
+            self._model_info_cache[collection_name] = model_info
+        return model_info
+
+    def _get_cached_admin_output(self, key: str) -> Optional[str]:
+        """Get admin tool output rendered within the last ADMIN_CACHE_TTL_SECONDS."""
+        hit = self._admin_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ADMIN_CACHE_TTL_SECONDS:
+            return hit[1]
+        return None
+
+    def _cache_admin_output(self, key: str, output: str) -> str:
+        """Remember admin tool output and return it."""
+        self._admin_cache[key] = (time.monotonic(), output)
+        return output
+
+    def _render_model_mappings(self) -> str:
+        """Render the qdrant_model_mappings output from the static mapping tables."""
+        parts = [_MODEL_MAPPINGS_HEADER]
+
+        for collection, model in COLLECTION_MODEL_MAPPINGS.items():
+            config = EMBEDDING_MODEL_CONFIGS.get(model)
+            parts.append(
+                _MODEL_MAPPING_TEMPLATE.format_map(
+                    {
+                        "collection": collection,
+                        "model": model,
+                        "dimensions": config.dimensions if config else "unknown",
+                        "fastembed_model": (
+                            config.fastembed_model if config else "unknown"
+                        ),
+                    }
+                )
+            )
+
+        parts.append(_MODEL_CONFIGS_HEADER)
+        for model, config in EMBEDDING_MODEL_CONFIGS.items():
+            parts.append(
+                _MODEL_CONFIG_TEMPLATE.format_map(
+                    {
+                        "model": model,
+                        "dimensions": config.dimensions,
+                        "fastembed_model": config.fastembed_model,
+                    }
+                )
+            )
+
+        return "".join(parts)
 
     def format_entry(self, entry: Entry) -> str:
         """Format entry for display."""
-        entry_metadata = json.dumps(entry.metadata) if entry.metadata else ""
-        return f"<entry><content>{entry.content}</content><metadata>{entry_metadata}</metadata></entry>"
+        content = entry.content
+        # Most content has no markup, so only pay for escaping when it does
+        if "<" in content or ">" in content or "&" in content:
+            content = escape(content)
+        entry_metadata = encode_metadata(entry.metadata) if entry.metadata else ""
+        return f"<entry><content>{content}</content><metadata>{entry_metadata}</metadata></entry>"
 
     def setup_tools(self):
         """Register the enhanced tools in the server."""
 
+        # Bind what the tools use once here instead of looking it up on every call
+        connector = self.qdrant_connector
+        admin_cache = self._admin_cache
+        cached_model_info = self._cached_model_info
+        get_cached_admin_output = self._get_cached_admin_output
+        cache_admin_output = self._cache_admin_output
+        debug_enabled = self._debug_enabled
+        model_mappings_output = self._model_mappings_output
+
         async def qdrant_store(
             ctx: Context,
             information: Annotated[
@@ -106,23 +351,26 @@ class QdrantMCPServer(FastMCP):
             :param metadata: Optional JSON metadata object to store alongside the document. Can be any valid JSON structure with unlimited nesting. Use for categorization, filtering, and additional context. Example: {"category": "tutorial", "tags": ["python"], "author": {"name": "John"}}.
             :return: A message indicating that the information was stored.
             """
-            await ctx.debug(
-                f"Enhanced storing information in collection {collection_name}"
-            )
+            if debug_enabled:
+                await ctx.debug(
+                    f"Enhanced storing information in collection {collection_name}"
+                )
 
             entry = Entry(content=information, metadata=metadata)
-            await self.qdrant_connector.store(entry, collection_name=collection_name)
+            await connector.store(entry, collection_name=collection_name)
+            # Point counts (and possibly the collection list) just changed
+            admin_cache.clear()
 
-            # Get model info for confirmation
-            model_info = (
-                self.qdrant_connector._embedding_provider.get_model_info_for_collection(
-                    collection_name
-                )
+            vector_name, dimensions = cached_model_info(collection_name)
+
+            # Large documents would otherwise be sent straight back to the client
+            preview = (
+                information
+                if len(information) <= _STORE_PREVIEW_CHARS
+                else information[:_STORE_PREVIEW_CHARS] + "..."
             )
-            vector_name = model_info.get("vector_name", "unknown")
-            dimensions = model_info.get("dimensions", "unknown")
 
-            return f"Stored in {collection_name} using {vector_name} ({dimensions}D): {information}"
+            return f"Stored in {collection_name} using {vector_name} ({dimensions}D): {preview}"
 
         async def qdrant_find(
             ctx: Context,
@@ -165,41 +413,47 @@ class QdrantMCPServer(FastMCP):
             :param score_threshold: Minimum similarity score for results (0.0-1.0). Default is 0.0 (return all results regardless of score). Higher values filter out less similar results. Typical useful range is 0.3-0.8 depending on use case.
             :return: Structured search results with metadata.
             """
-            await ctx.debug(
-                f"Enhanced searching in collection {collection_name} for: {query}"
-            )
+            if debug_enabled:
+                await ctx.debug(
+                    f"Enhanced searching in collection {collection_name} for: {query}"
+                )
 
             try:
                 # Execute enhanced search
-                search_results = await self.qdrant_connector.search(
+                search_results = await connector.search_coalesced(
                     query=query,
                     collection_name=collection_name,
                     limit=limit,
                     score_threshold=score_threshold,
                 )
 
+                # Let progress-aware clients know the vector search is done before
+                # the results are assembled; a no-op without a progress token
+                await ctx.report_progress(
+                    1, 2, message=f"Found {len(search_results)} results"
+                )
+
                 if not search_results:
                     return {
                         "query": query,
                         "collection": collection_name,
                         "results": [],
                         "total_found": 0,
-                        "message": f"No information found for query '{query}' in collection {collection_name}",
+                        "message": _NO_RESULTS_TEMPLATE.format(query, collection_name),
                     }
 
                 # Convert to structured response
-                results_data = []
-                for result in search_results:
-                    results_data.append(
-                        {
-                            "content": result.content,
-                            "score": round(result.score, 4),
-                            "metadata": result.metadata or {},
-                            "collection": result.collection_name,
-                            "vector_model": result.vector_name,
-                            "point_id": result.point_id,  # Include point ID for updates
-                        }
-                    )
+                results_data = [
+                    {
+                        "content": result.content,
+                        "score": round(result.score, 4),
+                        "metadata": result.metadata or {},
+                        "collection": result.collection_name,
+                        "vector_model": result.vector_name,
+                        "point_id": result.point_id,  # Include point ID for updates
+                    }
+                    for result in search_results
+                ]
 
                 return {
                     "query": query,
@@ -210,7 +464,7 @@ class QdrantMCPServer(FastMCP):
                         "limit": limit,
                         "score_threshold": score_threshold,
                     },
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": _utc_timestamp(),
                 }
 
             except Exception as e:
@@ -223,7 +477,7 @@ class QdrantMCPServer(FastMCP):
                     "results": [],
                     "total_found": 0,
                     "error": error_msg,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": _utc_timestamp(),
                 }
 
         async def qdrant_list_collections(ctx: Context) -> str:
@@ -233,32 +487,44 @@ class QdrantMCPServer(FastMCP):
             :param ctx: The context for the request.
             :return: Formatted list of collections with their info.
             """
-            await ctx.debug("Listing all collections with enhanced info")
+            if debug_enabled:
+                await ctx.debug("Listing all collections with enhanced info")
+
+            cached = get_cached_admin_output("list_collections")
+            if cached is not None:
+                return cached
 
             try:
-                collections_info = (
-                    await self.qdrant_connector.list_collections_with_info()
-                )
+                collections_info = await connector.list_collections_with_info()
 
                 if not collections_info:
                     return "No collections found in Qdrant."
 
-                result = "Qdrant Collections:\n\n"
+                parts = [_COLLECTIONS_HEADER]
                 for info in collections_info:
                     if "error" in info:
-                        result += (
-                            f"❌ {info['collection_name']}: Error - {info['error']}\n"
+                        parts.append(
+                            _COLLECTION_ERROR_TEMPLATE.format_map(
+                                {
+                                    "name": info["collection_name"],
+                                    "error": info["error"],
+                                }
+                            )
                         )
                         continue
 
-                    vector_config = info.get("vector_config", {})
-                    result += f"📊 **{info['collection_name']}**\n"
-                    result += f"   Status: {info.get('status', 'unknown')}\n"
-                    result += f"   Points: {info.get('points_count', 0)}\n"
-                    result += f"   Vector: {vector_config.get('vector_name', 'unknown')} ({vector_config.get('dimensions', 'unknown')}D)\n"
-                    result += f"   Model: {vector_config.get('fastembed_model', 'unknown')}\n\n"
+                    # Row fields are read straight from the info and its vector config
+                    parts.append(
+                        _COLLECTION_ROW_TEMPLATE.format_map(
+                            ChainMap(
+                                info,
+                                info.get("vector_config") or {},
+                                _COLLECTION_ROW_DEFAULTS,
+                            )
+                        )
+                    )
 
-                return result
+                return cache_admin_output("list_collections", "".join(parts))
 
             except Exception as e:
                 return f"Error listing collections: {str(e)}"
@@ -271,41 +537,44 @@ class QdrantMCPServer(FastMCP):
             :param collection_name: Name of the collection to inspect.
             :return: Detailed collection information.
             """
-            await ctx.debug(f"Getting detailed info for collection: {collection_name}")
+            if debug_enabled:
+                await ctx.debug(
+                    f"Getting detailed info for collection: {collection_name}"
+                )
+
+            cache_key = f"collection_info:{collection_name}"
+            cached = get_cached_admin_output(cache_key)
+            if cached is not None:
+                return cached
 
             try:
-                info = await self.qdrant_connector.get_collection_info(collection_name)
+                info = await connector.get_collection_info(collection_name)
 
                 if "error" in info:
                     return f"Error getting info for {collection_name}: {info['error']}"
 
-                vector_config = info.get("vector_config", {})
-                config = info.get("config", {})
+                vector_config = info.get("vector_config") or {}
+                config = info.get("config") or {}
 
-                result = f"🔍 **Collection: {collection_name}**\n\n"
-                result += f"**Status:** {info.get('status', 'unknown')}\n"
-                result += f"**Points:** {info.get('points_count', 0)}\n"
-                result += (
-                    f"**Indexed Vectors:** {info.get('indexed_vectors_count', 0)}\n\n"
-                )
-
-                result += "**Vector Configuration:**\n"
-                result += (
-                    f"   Vector Name: {vector_config.get('vector_name', 'unknown')}\n"
-                )
-                result += (
-                    f"   Dimensions: {vector_config.get('dimensions', 'unknown')}\n"
+                return cache_admin_output(
+                    cache_key,
+                    _COLLECTION_INFO_TEMPLATE.format_map(
+                        {
+                            "name": collection_name,
+                            "status": info.get("status", "unknown"),
+                            "points": info.get("points_count", 0),
+                            "indexed_vectors": info.get("indexed_vectors_count", 0),
+                            "vector_name": vector_config.get("vector_name", "unknown"),
+                            "dimensions": vector_config.get("dimensions", "unknown"),
+                            "fastembed_model": vector_config.get(
+                                "fastembed_model", "unknown"
+                            ),
+                            "quantization": "Enabled"
+                            if config.get("quantization_config")
+                            else "Disabled",
+                        }
+                    ),
                 )
-                result += f"   FastEmbed Model: {vector_config.get('fastembed_model', 'unknown')}\n\n"
-
-                if config.get("quantization_config"):
-                    result += "**Optimizations:**\n"
-                    result += "   Quantization: Enabled\n"
-                else:
-                    result += "**Optimizations:**\n"
-                    result += "   Quantization: Disabled\n"
-
-                return result
 
             except Exception as e:
                 return f"Error getting collection info: {str(e)}"
@@ -349,30 +618,29 @@ class QdrantMCPServer(FastMCP):
             :param batch_size: Number of documents to process in each batch for memory and performance optimization. Default is 100. Recommended values: 100-500 for small documents, 10-50 for large documents, 1-10 for memory constrained environments. Affects memory usage and API call frequency.
             :return: Storage results with statistics.
             """
-            await ctx.debug(
-                f"Bulk storing {len(documents)} documents in collection {collection_name}"
-            )
+            if debug_enabled:
+                await ctx.debug(
+                    f"Bulk storing {len(documents)} documents in collection {collection_name}"
+                )
 
             if metadata_list and len(metadata_list) != len(documents):
                 raise ValueError("metadata_list length must match documents length")
 
-            # Create entries from documents and metadata
-            entries = []
-            for i, document in enumerate(documents):
-                metadata = metadata_list[i] if metadata_list else None
-                entries.append(Entry(content=document, metadata=metadata))
+            # Create entries from documents and metadata off the event loop
+            entries = await asyncio.to_thread(_build_entries, documents, metadata_list)
 
             # Execute bulk store operation
-            result = await self.qdrant_connector.bulk_store(
+            result = await connector.bulk_store(
                 entries=entries, collection_name=collection_name, batch_size=batch_size
             )
+            admin_cache.clear()
 
             # Add operation context to result
             result.update(
                 {
                     "operation": "bulk_store",
                     "requested_documents": len(documents),
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": _utc_timestamp(),
                 }
             )
 
@@ -385,29 +653,10 @@ class QdrantMCPServer(FastMCP):
             :param ctx: The context for the request.
             :return: Current model mappings configuration.
             """
-            await ctx.debug("Showing collection-to-model mappings")
-
-            from mcp_server_qdrant.enhanced_settings import (
-                COLLECTION_MODEL_MAPPINGS,
-                EMBEDDING_MODEL_CONFIGS,
-            )
+            if debug_enabled:
+                await ctx.debug("Showing collection-to-model mappings")
 
-            result = "📋 **Collection Model Mappings:**\n\n"
-
-            for collection, model in COLLECTION_MODEL_MAPPINGS.items():
-                config = EMBEDDING_MODEL_CONFIGS.get(model, {})
-                result += f"**{collection}**\n"
-                result += f"   Model: {model}\n"
-                result += f"   Dimensions: {config.get('dimensions', 'unknown')}\n"
-                result += (
-                    f"   FastEmbed: {config.get('fastembed_model', 'unknown')}\n\n"
-                )
-
-            result += "📚 **Available Model Configs:**\n\n"
-            for model, config in EMBEDDING_MODEL_CONFIGS.items():
-                result += f"**{model}**: {config.get('dimensions')}D ({config.get('fastembed_model')})\n"
-
-            return result
+            return model_mappings_output
 
         async def qdrant_get_point(
             ctx: Context,
@@ -429,15 +678,16 @@ class QdrantMCPServer(FastMCP):
             :param collection_name: Name of the collection containing the point.
             :return: Point data including ID, payload (document + metadata), and collection name.
             """
-            await ctx.debug(
-                f"Retrieving point {point_id} from collection {collection_name}"
-            )
+            if debug_enabled:
+                await ctx.debug(
+                    f"Retrieving point {point_id} from collection {collection_name}"
+                )
 
-            result = await self.qdrant_connector.get_point(
+            result = await connector.get_point(
                 point_id=point_id, collection_name=collection_name
             )
 
-            result["timestamp"] = datetime.utcnow().isoformat()
+            result["timestamp"] = _utc_timestamp()
             return result
 
         async def qdrant_update_payload(
@@ -481,18 +731,19 @@ class QdrantMCPServer(FastMCP):
             :param key: Optional nested path to update within (e.g., 'metadata' to update metadata.field).
             :return: Update result with success status and details.
             """
-            await ctx.debug(
-                f"Updating {len(point_ids)} points in collection {collection_name}"
-            )
+            if debug_enabled:
+                await ctx.debug(
+                    f"Updating {len(point_ids)} points in collection {collection_name}"
+                )
 
-            result = await self.qdrant_connector.update_payload(
+            result = await connector.update_payload(
                 point_ids=point_ids,
                 payload=payload,
                 collection_name=collection_name,
                 key=key,
             )
 
-            result["timestamp"] = datetime.utcnow().isoformat()
+            result["timestamp"] = _utc_timestamp()
             return result
 
         async def qdrant_delete_points(
@@ -521,102 +772,32 @@ class QdrantMCPServer(FastMCP):
             :param collection_name: Target collection.
             :return: Deletion result with success status and count.
             """
-            await ctx.debug(f"Deleting {len(point_ids)} points from {collection_name}")
+            if debug_enabled:
+                await ctx.debug(
+                    f"Deleting {len(point_ids)} points from {collection_name}"
+                )
 
-            result = await self.qdrant_connector.delete_points(
+            result = await connector.delete_points(
                 point_ids=point_ids, collection_name=collection_name
             )
+            admin_cache.clear()
 
-            result["timestamp"] = datetime.utcnow().isoformat()
+            result["timestamp"] = _utc_timestamp()
             return result
 
         # Register tools with enhanced descriptions and annotations
-        self.tool(
-            description="Store information in Qdrant with automatic collection-specific embedding model selection.",
-            annotations=ToolAnnotations(
-                readOnlyHint=False,  # Modifies database
-                destructiveHint=False,  # Creates, doesn't destroy
-                idempotentHint=True,  # Same content → same embedding
-                openWorldHint=False,  # Local Qdrant instance
-            ),
-        )(qdrant_store)
-
-        self.tool(
-            description="Store multiple documents efficiently in Qdrant with collection-specific embedding models and batch processing.",
-            annotations=ToolAnnotations(
-                readOnlyHint=False,  # Modifies database
-                destructiveHint=False,  # Creates, doesn't destroy
-                idempotentHint=True,  # Same documents → same embeddings
-                openWorldHint=False,  # Local Qdrant instance
-            ),
-        )(qdrant_bulk_store)
-
-        self.tool(
-            description="Search for information in Qdrant using collection-specific embedding model with structured results.",
-            annotations=ToolAnnotations(
-                readOnlyHint=True,  # Only reads data
-                destructiveHint=False,  # No modifications
-                idempotentHint=True,  # Same query → same results
-                openWorldHint=False,  # Local Qdrant instance
-            ),
-        )(qdrant_find)
-
-        self.tool(
-            description="List all Qdrant collections with their configurations and model information.",
-            annotations=ToolAnnotations(
-                readOnlyHint=True,  # Only reads metadata
-                destructiveHint=False,  # No modifications
-                idempotentHint=True,  # Consistent listing
-                openWorldHint=False,  # Local Qdrant instance
-            ),
-        )(qdrant_list_collections)
-
-        self.tool(
-            description="Get detailed information about a specific Qdrant collection.",
-            annotations=ToolAnnotations(
-                readOnlyHint=True,  # Only reads metadata
-                destructiveHint=False,  # No modifications
-                idempotentHint=True,  # Consistent info
-                openWorldHint=False,  # Local Qdrant instance
-            ),
-        )(qdrant_collection_info)
-
-        self.tool(
-            description="Show current collection-to-model mappings and available configurations.",
-            annotations=ToolAnnotations(
-                readOnlyHint=True,  # Only reads config
-                destructiveHint=False,  # No modifications
-                idempotentHint=True,  # Static configuration
-                openWorldHint=False,  # In-memory config
-            ),
-        )(qdrant_model_mappings)
-
-        self.tool(
-            description="Retrieve a single point by ID for inspection or verification after updates.",
-            annotations=ToolAnnotations(
-                readOnlyHint=True,  # Only reads data
-                destructiveHint=False,  # No modifications
-                idempotentHint=True,  # Same ID → same result
-                openWorldHint=False,  # Local Qdrant instance
-            ),
-        )(qdrant_get_point)
-
-        self.tool(
-            description="Update payload fields on existing points without re-embedding (10-100x faster than re-storing). Uses merge semantics. IMPORTANT: Qdrant payloads have nested structure (payload.document + payload.metadata). Use key='metadata' to update metadata fields like sync_status, synced_to_asana. Without key parameter, updates write to root payload level instead of nested metadata.",
-            annotations=ToolAnnotations(
-                readOnlyHint=False,  # Modifies database
-                destructiveHint=False,  # Merges, doesn't destroy
-                idempotentHint=True,  # Same update → same result
-                openWorldHint=False,  # Local Qdrant instance
-            ),
-        )(qdrant_update_payload)
-
-        self.tool(
-            description="Delete points from a Qdrant collection by their IDs. WARNING: PERMANENT operation - cannot be undone. Get point_ids from qdrant_find search results.",
-            annotations=ToolAnnotations(
-                readOnlyHint=False,  # Modifies database
-                destructiveHint=True,  # PERMANENT deletion
-                idempotentHint=True,  # Deleting same IDs twice is safe
-                openWorldHint=False,  # Local Qdrant instance
-            ),
-        )(qdrant_delete_points)
+        for tool in (
+            qdrant_store,
+            qdrant_bulk_store,
+            qdrant_find,
+            qdrant_list_collections,
+            qdrant_collection_info,
+            qdrant_model_mappings,
+            qdrant_get_point,
+            qdrant_update_payload,
+            qdrant_delete_points,
+        ):
+            self.tool(
+                description=_TOOL_DESCRIPTIONS[tool.__name__],
+                annotations=_TOOL_ANNOTATIONS[tool.__name__],
+            )(tool)
@@ -0,0 +1,185 @@
+"""
+In-process semantic cache that reuses search results for near-duplicate queries.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+# Candidates kept by the binary-code scan and re-scored with the int8 vectors
+RERANK_CANDIDATES = 8
+
+if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+    _bit_count = np.bitwise_count
+else:
+    _POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _bit_count(bits: np.ndarray) -> np.ndarray:
+        return _POPCOUNT[bits]
+
+
+class _Bucket:
+    """Cached query embeddings and results for one collection and search configuration."""
+
+    __slots__ = (
+        "dimensions",
+        "codes",
+        "vectors",
+        "results",
+        "stored_at",
+        "lru",
+        "filled",
+    )
+
+    def __init__(self, max_entries: int, dimensions: int):
+        self.dimensions = dimensions
+        # One sign bit per dimension for the scan, int8 components for re-scoring
+        self.codes = np.zeros((max_entries, (dimensions + 7) // 8), dtype=np.uint8)
+        self.vectors = np.zeros((max_entries, dimensions), dtype=np.int8)
+        self.results: List[Any] = [None] * max_entries
+        self.stored_at = np.zeros(max_entries, dtype=np.float64)
+        # Slot indices, least recently used first
+        self.lru: "OrderedDict[int, None]" = OrderedDict()
+        self.filled = 0
+
+
+class SemanticCache:
+    """
+    Reuse search results for queries whose embeddings are nearly identical to a recent one.
+
+    Query embeddings are kept per collection and search configuration as packed sign
+    bits plus int8 components, about a quarter of the float32 size. A lookup scans
+    the sign bits by Hamming distance and re-scores the closest few candidates
+    against the int8 vectors to get their cosine similarity. Entries are evicted
+    least recently used first and expire after `ttl_seconds`, which bounds staleness
+    for writes made by other processes; writes through this process should call
+    `invalidate` for the collection.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl_seconds: float = 60.0,
+    ):
+        """
+        :param threshold: Minimum cosine similarity for a cached query to match.
+        :param max_entries: Maximum cached queries per collection and search configuration.
+        :param ttl_seconds: How long cached results may be served.
+        """
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._buckets: Dict[str, Dict[Hashable, _Bucket]] = {}
+        self._generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def get(
+        self, collection_name: str, params: Hashable, vector: Sequence[float]
+    ) -> Optional[Any]:
+        """
+        Get the results cached for the most similar query, if it is similar enough.
+
+        :param collection_name: Collection the search runs against.
+        :param params: Other search parameters that affect the results (e.g. limit).
+        :param vector: Embedding of the query.
+        :return: The cached results, or None on a miss.
+        """
+        bucket = self._buckets.get(collection_name, {}).get(params)
+        query = self._normalize(vector)
+        if bucket is None or not bucket.filled or bucket.dimensions != query.shape[0]:
+            self.misses += 1
+            return None
+
+        filled = bucket.filled
+        hamming = _bit_count(bucket.codes[:filled] ^ np.packbits(query > 0)).sum(
+            axis=1, dtype=np.int32
+        )
+        # Expired slots never match
+        expired = bucket.stored_at[:filled] < time.monotonic() - self._ttl_seconds
+        hamming[expired] = np.iinfo(np.int32).max
+
+        if filled > RERANK_CANDIDATES:
+            candidates = np.argpartition(hamming, RERANK_CANDIDATES)[:RERANK_CANDIDATES]
+        else:
+            candidates = np.arange(filled)
+        candidates = candidates[~expired[candidates]]
+
+        scores = bucket.vectors[candidates].astype(np.float32) @ query / 127.0
+        if not len(scores) or scores.max() < self._threshold:
+            self.misses += 1
+            return None
+
+        best = int(candidates[np.argmax(scores)])
+        bucket.lru.move_to_end(best)
+        self.hits += 1
+        return bucket.results[best]
+
+    def put(
+        self,
+        collection_name: str,
+        params: Hashable,
+        vector: Sequence[float],
+        results: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache the results of a search.
+
+        :param collection_name: Collection the search ran against.
+        :param params: Other search parameters that affect the results (e.g. limit).
+        :param vector: Embedding of the query.
+        :param results: Results to serve for similar queries.
+        :param generation: Collection generation read before the search started; the
+            results are dropped if the collection was invalidated in the meantime.
+        """
+        if generation is not None and generation != self.generation(collection_name):
+            return
+
+        query = self._normalize(vector)
+        buckets = self._buckets.setdefault(collection_name, {})
+        bucket = buckets.get(params)
+        if bucket is None or bucket.dimensions != query.shape[0]:
+            bucket = buckets[params] = _Bucket(self._max_entries, query.shape[0])
+
+        if bucket.filled < self._max_entries:
+            slot = bucket.filled
+            bucket.filled += 1
+        else:
+            slot, _ = bucket.lru.popitem(last=False)
+
+        bucket.codes[slot] = np.packbits(query > 0)
+        bucket.vectors[slot] = np.round(query * 127.0)
+        bucket.results[slot] = results
+        bucket.stored_at[slot] = time.monotonic()
+        bucket.lru[slot] = None
+
+    def generation(self, collection_name: str) -> int:
+        """Get a counter that changes every time the collection is invalidated."""
+        return self._generations.get(collection_name, 0)
+
+    def invalidate(self, collection_name: str) -> None:
+        """Forget every cached search on a collection."""
+        self._buckets.pop(collection_name, None)
+        self._generations[collection_name] = self.generation(collection_name) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and the number of cached queries."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": sum(
+                bucket.filled
+                for buckets in self._buckets.values()
+                for bucket in buckets.values()
+            ),
+        }
@@ -5,11 +5,17 @@ This module provides TypeScript-inspired type guards and validation functions
 for ensuring data integrity and type safety throughout the application.
 """
 
+import json
 import logging
 from typing import Any, Dict, TypeGuard, List
 
 logger = logging.getLogger(__name__)
 
+# The one encoder for metadata, shared by validation and display: compact, with
+# non-ASCII text kept as is. Built once, since json.dumps creates a new encoder on
+# every call with non-default options
+_METADATA_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
 
 def is_valid_entry_payload(payload: Dict[str, Any]) -> TypeGuard[Dict[str, Any]]:
     """
@@ -103,6 +109,22 @@ def validate_search_results(results: List[Any]) -> List[Any]:
     return validated
 
 
+def encode_metadata(metadata: Dict[str, Any]) -> str:
+    """
+    Serialize metadata to compact JSON.
+
+    Args:
+        metadata: Metadata to serialize
+
+    Returns:
+        The JSON text
+
+    Raises:
+        TypeError, ValueError: If the metadata is not JSON serializable
+    """
+    return _METADATA_ENCODER.encode(metadata)
+
+
 def validate_metadata(metadata: Any) -> bool:
     """
     Validate metadata dictionary.
@@ -121,11 +143,9 @@ def validate_metadata(metadata: Any) -> bool:
 
     # Check for reasonable size limit (10KB serialized)
     try:
-        import json
-
-        serialized = json.dumps(metadata)
-        if len(serialized) > 10240:  # 10KB limit
-            logger.warning(f"Metadata too large: {len(serialized)} bytes")
+        size = len(encode_metadata(metadata).encode())
+        if size > 10240:  # 10KB limit
+            logger.warning(f"Metadata too large: {size} bytes")
             return False
     except (TypeError, ValueError) as e:
         logger.warning(f"Metadata not JSON serializable: {e}")
@@ -43,7 +43,7 @@ class StressTestRunner:
         """Initialize the Qdrant connector"""
         print("🔧 Initializing Enhanced Qdrant Connector...")
         self.connector = EnhancedQdrantConnector(self.settings, self.embedding_settings)
-        await self.connector._ensure_connection()
+        await self.connector.warm_up()
         print("✅ Connector initialized successfully")
 
     def generate_test_documents(self, count: int) -> List[Dict[str, Any]]:
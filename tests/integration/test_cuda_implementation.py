@@ -179,7 +179,7 @@ class CUDATestRunner:
             cuda_embedding_settings = EnhancedEmbeddingProviderSettings()
             cuda_connector = EnhancedQdrantConnector(cuda_settings, cuda_embedding_settings)
 
-            await cuda_connector._ensure_connection()
+            await cuda_connector.warm_up()
 
             # Performance test with CUDA
             cuda_start = time.time()
@@ -216,7 +216,7 @@ class CUDATestRunner:
             cpu_embedding_settings = EnhancedEmbeddingProviderSettings()
             cpu_connector = EnhancedQdrantConnector(cpu_settings, cpu_embedding_settings)
 
-            await cpu_connector._ensure_connection()
+            await cpu_connector.warm_up()
 
             # Performance test with CPU
             cpu_start = time.time()
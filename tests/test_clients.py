@@ -0,0 +1,33 @@
+import pytest
+
+from mcp_server_qdrant.clients import close_async_clients, get_async_client
+
+
+@pytest.mark.asyncio
+class TestSharedAsyncClients:
+    """Tests for the shared AsyncQdrantClient registry."""
+
+    async def test_same_config_reuses_client(self):
+        """Test that identical arguments return the same client instance."""
+        try:
+            assert get_async_client(location=":memory:") is get_async_client(
+                location=":memory:"
+            )
+        finally:
+            await close_async_clients()
+
+    async def test_different_config_gets_new_client(self):
+        """Test that different arguments return distinct clients."""
+        try:
+            memory_client = get_async_client(location=":memory:")
+            remote_client = get_async_client(host="localhost", prefer_grpc=True)
+            assert memory_client is not remote_client
+        finally:
+            await close_async_clients()
+
+    async def test_close_forgets_clients(self):
+        """Test that closed clients are replaced on the next request."""
+        client = get_async_client(location=":memory:")
+        await close_async_clients()
+        assert get_async_client(location=":memory:") is not client
+        await close_async_clients()
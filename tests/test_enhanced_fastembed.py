@@ -0,0 +1,90 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from mcp_server_qdrant.embeddings.enhanced_fastembed import EnhancedFastEmbedProvider
+from mcp_server_qdrant.enhanced_settings import EnhancedEmbeddingProviderSettings
+
+
+@pytest.fixture
+def provider():
+    """Fixture to provide an EnhancedFastEmbedProvider with the default model."""
+    settings = EnhancedEmbeddingProviderSettings()
+    return EnhancedFastEmbedProvider(settings, default_model=settings.model_name)
+
+
+@pytest.mark.asyncio
+class TestEnhancedFastEmbedProvider:
+    """Integration tests for EnhancedFastEmbedProvider."""
+
+    async def test_concurrent_embed_documents_are_batched(self, provider):
+        """Test that concurrent calls each receive their own embeddings."""
+        requests = [
+            ["First document.", "Second document."],
+            ["Third document."],
+            ["Fourth document.", "Fifth document.", "Sixth document."],
+        ]
+
+        results = await asyncio.gather(
+            *(provider.embed_documents(docs, "working_solutions") for docs in requests)
+        )
+
+        for documents, embeddings in zip(requests, results):
+            assert len(embeddings) == len(documents)
+            assert all(len(embedding) == 384 for embedding in embeddings)
+
+        # Batched results must match embedding each request on its own
+        sequential = await provider.embed_documents(requests[1], "working_solutions")
+        np.testing.assert_array_almost_equal(
+            np.array(results[1]), np.array(sequential), decimal=5
+        )
+
+    async def test_embed_documents_empty(self, provider):
+        """Test that an empty document list returns no embeddings."""
+        assert await provider.embed_documents([], "working_solutions") == []
+
+    async def test_aiter_embed_documents_spans_slices(self, provider):
+        """Test that streamed embeddings match embed_documents across several slices."""
+        documents = [f"Streamed document {i}." for i in range(5)]
+        provider._batch_max = 2
+
+        streamed = [
+            embedding
+            async for embedding in provider.aiter_embed_documents(
+                documents, "working_solutions"
+            )
+        ]
+
+        assert len(streamed) == len(documents)
+        provider._document_cache.clear()
+        expected = await provider.embed_documents(documents, "working_solutions")
+        np.testing.assert_array_almost_equal(
+            np.array(streamed), np.array(expected), decimal=5
+        )
+
+    async def test_embed_query_is_cached(self, provider):
+        """Test that repeated queries are served from the query cache."""
+        first = await provider.embed_query("cached query", "working_solutions")
+        second = await provider.embed_query("cached query", "working_solutions")
+
+        assert first == second
+        stats = provider.get_query_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    async def test_embed_documents_reuses_cached_documents(self, provider):
+        """Test that already embedded documents are served from the document cache."""
+        first = await provider.embed_documents(["Cached document."], "working_solutions")
+        mixed = await provider.embed_documents(
+            ["New document.", "Cached document."], "working_solutions"
+        )
+
+        np.testing.assert_array_almost_equal(
+            np.array(mixed[1]), np.array(first[0]), decimal=5
+        )
+        stats = provider.get_document_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["size"] == 2
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Test batched search functionality for EnhancedQdrantConnector.
+"""
+
+import asyncio
+import types
+import uuid
+
+import pytest
+
+from mcp_server_qdrant import enhanced_qdrant
+from mcp_server_qdrant.enhanced_qdrant import (
+    INDEXING_THRESHOLD,
+    EnhancedQdrantConnector,
+    Entry,
+)
+from mcp_server_qdrant.enhanced_settings import (
+    EnhancedEmbeddingProviderSettings,
+    EnhancedQdrantSettings,
+)
+
+
+@pytest.fixture
+async def enhanced_connector(monkeypatch):
+    """Fixture to provide an EnhancedQdrantConnector with in-memory Qdrant."""
+    monkeypatch.setenv("QDRANT_URL", ":memory:")
+    settings = EnhancedQdrantSettings()
+    embedding_settings = EnhancedEmbeddingProviderSettings()
+    connector = EnhancedQdrantConnector(settings, embedding_settings)
+    yield connector
+
+
+async def _store_fixtures(connector, collection_name):
+    for content in [
+        "Python is a programming language",
+        "The Eiffel Tower is located in Paris",
+    ]:
+        await connector.store(Entry(content=content), collection_name=collection_name)
+
+
+@pytest.mark.asyncio
+async def test_search_batch_matches_individual_search(enhanced_connector):
+    """Test that a batch search returns the same hits as separate searches."""
+    collection_name = f"test_search_{uuid.uuid4().hex}"
+    await _store_fixtures(enhanced_connector, collection_name)
+
+    queries = ["Python programming", "Eiffel Tower Paris"]
+    batched = await enhanced_connector.search_batch(
+        queries, collection_name=collection_name, limit=1
+    )
+
+    assert len(batched) == len(queries)
+    for query, results in zip(queries, batched):
+        single = await enhanced_connector.search(
+            query, collection_name=collection_name, limit=1
+        )
+        assert [r.point_id for r in results] == [r.point_id for r in single]
+
+
+@pytest.mark.asyncio
+async def test_search_coalesced_concurrent(enhanced_connector):
+    """Test that concurrent coalesced searches each get their own results."""
+    collection_name = f"test_search_{uuid.uuid4().hex}"
+    await _store_fixtures(enhanced_connector, collection_name)
+
+    python_results, paris_results = await asyncio.gather(
+        enhanced_connector.search_coalesced(
+            "Python programming", collection_name=collection_name, limit=1
+        ),
+        enhanced_connector.search_coalesced(
+            "Eiffel Tower Paris", collection_name=collection_name, limit=1
+        ),
+    )
+
+    assert "Python" in python_results[0].content
+    assert "Eiffel" in paris_results[0].content
+
+
+@pytest.mark.asyncio
+async def test_search_coalesced_retries_outside_worker(enhanced_connector, monkeypatch):
+    """Test that a failed coalesced search is retried by its caller."""
+    calls = []
+
+    async def flaky_batch(collection_name, requests):
+        calls.append(requests)
+        if len(calls) == 1:
+            raise RuntimeError("temporary failure")
+        return [[] for _ in requests]
+
+    monkeypatch.setattr(enhanced_connector, "_search_batch_requests", flaky_batch)
+
+    assert await enhanced_connector.search_coalesced("anything", "docs") == []
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_search_worker_exits(enhanced_connector, monkeypatch):
+    """Test that a collection's search worker is dropped once its queue is idle."""
+
+    async def empty_batch(collection_name, requests):
+        return [[] for _ in requests]
+
+    monkeypatch.setattr(enhanced_connector, "_search_batch_requests", empty_batch)
+    monkeypatch.setattr(enhanced_qdrant, "SEARCH_WORKER_IDLE_SECONDS", 0.01)
+
+    await enhanced_connector.search_coalesced("anything", "docs")
+    worker = enhanced_connector._search_workers["docs"]
+    await worker
+
+    assert "docs" not in enhanced_connector._search_workers
+    assert "docs" not in enhanced_connector._search_queues
+
+
+@pytest.mark.asyncio
+async def test_search_batch_missing_collection(enhanced_connector):
+    """Test that batch searches on a missing collection return empty results."""
+    results = await enhanced_connector.search_batch(
+        ["anything", "else"], collection_name=f"missing_{uuid.uuid4().hex}"
+    )
+    assert results == [[], []]
+
+
+@pytest.mark.asyncio
+async def test_store_many_entries_are_searchable(enhanced_connector):
+    """Test that entries stored together keep their own content and metadata."""
+    collection_name = f"test_search_{uuid.uuid4().hex}"
+    await enhanced_connector.store_many(
+        [
+            Entry(content="Python is a programming language", metadata={"n": 1}),
+            Entry(content="The Eiffel Tower is located in Paris", metadata={"n": 2}),
+        ],
+        collection_name=collection_name,
+    )
+
+    results = await enhanced_connector.search(
+        "Eiffel Tower Paris", collection_name=collection_name, limit=1
+    )
+    assert "Eiffel" in results[0].content
+    assert results[0].metadata == {"n": 2}
+
+
+@pytest.mark.asyncio
+async def test_bulk_store_stream_stores_every_entry(enhanced_connector):
+    """Test that entries read from an async iterable are stored across chunks."""
+    collection_name = f"test_search_{uuid.uuid4().hex}"
+
+    async def entries():
+        for i in range(5):
+            yield Entry(content=f"Streamed document number {i}", metadata={"n": i})
+
+    result = await enhanced_connector.bulk_store_stream(
+        entries(),
+        collection_name=collection_name,
+        batch_size=2,
+        max_concurrent_batches=1,
+    )
+
+    assert result["stored_count"] == 5
+    results = await enhanced_connector.search(
+        "Streamed document", collection_name=collection_name, limit=10
+    )
+    assert sorted(r.metadata["n"] for r in results) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_storing_same_content_replaces_point(enhanced_connector):
+    """Test that re-storing identical content updates the existing point."""
+    collection_name = f"test_search_{uuid.uuid4().hex}"
+    await enhanced_connector.store(
+        Entry(content="Python is a programming language", metadata={"v": 1}),
+        collection_name=collection_name,
+    )
+    await enhanced_connector.store(
+        Entry(content="Python is a programming language", metadata={"v": 2}),
+        collection_name=collection_name,
+    )
+
+    results = await enhanced_connector.search(
+        "Python programming", collection_name=collection_name, limit=10
+    )
+    assert len(results) == 1
+    assert results[0].metadata == {"v": 2}
+
+
+@pytest.mark.asyncio
+async def test_search_skips_existence_check_for_known_collection(
+    enhanced_connector, monkeypatch
+):
+    """Test that a recently confirmed collection is not re-checked on every search."""
+    collection_name = f"test_search_{uuid.uuid4().hex}"
+    await _store_fixtures(enhanced_connector, collection_name)
+
+    async def fail_collection_exists(name):
+        raise AssertionError("collection_exists should not be called")
+
+    monkeypatch.setattr(
+        enhanced_connector._client, "collection_exists", fail_collection_exists
+    )
+
+    results = await enhanced_connector.search(
+        "Python programming", collection_name=collection_name, limit=1
+    )
+    assert "Python" in results[0].content
+
+
+@pytest.mark.asyncio
+async def test_overlapping_indexing_pauses_restore_threshold_once(
+    enhanced_connector, monkeypatch
+):
+    """Test that overlapping pauses restore the original threshold, never 0."""
+    thresholds = [0]  # Left at 0 by an interrupted ingest
+    updates = []
+
+    async def get_collection(name):
+        config = types.SimpleNamespace(
+            optimizer_config=types.SimpleNamespace(indexing_threshold=thresholds[-1])
+        )
+        return types.SimpleNamespace(config=config)
+
+    async def update_collection(collection_name, optimizers_config):
+        thresholds.append(optimizers_config.indexing_threshold)
+        updates.append(optimizers_config.indexing_threshold)
+
+    monkeypatch.setattr(enhanced_connector._client, "get_collection", get_collection)
+    monkeypatch.setattr(
+        enhanced_connector._client, "update_collection", update_collection
+    )
+
+    first = enhanced_connector._indexing_paused("docs")
+    second = enhanced_connector._indexing_paused("docs")
+    await first.__aenter__()
+    await second.__aenter__()
+    await first.__aexit__(None, None, None)
+    assert updates == [0]
+
+    await second.__aexit__(None, None, None)
+    assert updates == [0, INDEXING_THRESHOLD]
+
+
+@pytest.mark.asyncio
+async def test_bulk_store_skips_only_the_batch_that_failed_to_embed(
+    enhanced_connector, monkeypatch
+):
+    """Test that an embedding failure drops its batch and the rest is still stored."""
+    collection_name = f"test_search_{uuid.uuid4().hex}"
+    provider = enhanced_connector._embedding_provider
+
+    async def failing_embeddings(documents, collection_name):
+        for document in documents:
+            if document == "bad x":
+                raise RuntimeError("embedding failed")
+            yield (await provider.embed_documents([document], collection_name))[0]
+
+    monkeypatch.setattr(provider, "aiter_embed_documents", failing_embeddings)
+
+    # Equal lengths keep the input order, so the batches are [0, 1], [2, 3], [4]
+    result = await enhanced_connector.bulk_store(
+        [Entry(content=c) for c in ["doc a", "doc b", "bad x", "doc d", "doc e"]],
+        collection_name=collection_name,
+        batch_size=2,
+    )
+
+    assert result["success"] is False
+    assert result["stored_count"] == 3
+    assert result["unembedded_count"] == 2
+    assert result["failed_batches"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_store_waits_when_last_batch_fails_to_embed(
+    enhanced_connector, monkeypatch
+):
+    """Test that bulk_store still ends with a waited upsert if its last batch fails."""
+    collection_name = f"test_search_{uuid.uuid4().hex}"
+    provider = enhanced_connector._embedding_provider
+    client = enhanced_connector._client
+    upsert = client.upsert
+    waits = []
+
+    async def failing_embeddings(documents, collection_name):
+        for document in documents:
+            if document == "bad x":
+                raise RuntimeError("embedding failed")
+            yield (await provider.embed_documents([document], collection_name))[0]
+
+    async def recording_upsert(collection_name, points, wait):
+        waits.append(wait)
+        return await upsert(collection_name=collection_name, points=points, wait=wait)
+
+    monkeypatch.setattr(provider, "aiter_embed_documents", failing_embeddings)
+    monkeypatch.setattr(client, "upsert", recording_upsert)
+
+    # Batches are [0, 1] and [2, 3]; the last one fails to embed
+    result = await enhanced_connector.bulk_store(
+        [Entry(content=c) for c in ["doc a", "doc b", "doc c", "bad x"]],
+        collection_name=collection_name,
+        batch_size=2,
+    )
+
+    assert result["stored_count"] == 2
+    assert result["unembedded_count"] == 2
+    assert waits[-1] is True
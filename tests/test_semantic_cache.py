@@ -0,0 +1,76 @@
+import numpy as np
+
+from mcp_server_qdrant.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Unit tests for SemanticCache."""
+
+    def test_similar_query_hits(self):
+        """Test that a near-identical embedding returns the cached results."""
+        cache = SemanticCache(threshold=0.95)
+        cache.put("docs", (10, 0.0), [1.0, 0.0, 0.0], ["result"])
+
+        assert cache.get("docs", (10, 0.0), [0.99, 0.05, 0.0]) == ["result"]
+        assert cache.get_stats()["hits"] == 1
+
+    def test_dissimilar_query_misses(self):
+        """Test that an unrelated embedding does not match."""
+        cache = SemanticCache(threshold=0.95)
+        cache.put("docs", (10, 0.0), [1.0, 0.0, 0.0], ["result"])
+
+        assert cache.get("docs", (10, 0.0), [0.0, 1.0, 0.0]) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_params_and_collection_are_separate(self):
+        """Test that other search parameters and collections never share entries."""
+        cache = SemanticCache()
+        cache.put("docs", (10, 0.0), [1.0, 0.0], ["result"])
+
+        assert cache.get("docs", (5, 0.0), [1.0, 0.0]) is None
+        assert cache.get("other", (10, 0.0), [1.0, 0.0]) is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = SemanticCache(max_entries=2)
+        cache.put("docs", None, [1.0, 0.0, 0.0], ["a"])
+        cache.put("docs", None, [0.0, 1.0, 0.0], ["b"])
+        assert cache.get("docs", None, [1.0, 0.0, 0.0]) == ["a"]
+
+        cache.put("docs", None, [0.0, 0.0, 1.0], ["c"])
+
+        assert cache.get("docs", None, [0.0, 1.0, 0.0]) is None
+        assert cache.get("docs", None, [1.0, 0.0, 0.0]) == ["a"]
+        assert cache.get("docs", None, [0.0, 0.0, 1.0]) == ["c"]
+
+    def test_expired_entries_miss(self):
+        """Test that entries older than the TTL are not served."""
+        cache = SemanticCache(ttl_seconds=0.0)
+        cache.put("docs", None, [1.0, 0.0], ["result"])
+
+        assert cache.get("docs", None, [1.0, 0.0]) is None
+
+    def test_invalidate_drops_in_flight_results(self):
+        """Test that results from a search overlapping a write are not cached."""
+        cache = SemanticCache()
+        cache.put("docs", None, [1.0, 0.0], ["old"])
+        generation = cache.generation("docs")
+
+        cache.invalidate("docs")
+        cache.put("docs", None, [1.0, 0.0], ["stale"], generation)
+
+        assert cache.get("docs", None, [1.0, 0.0]) is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_finds_match_among_many_entries(self):
+        """Test that the binary scan keeps the matching entry among many cached queries."""
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((200, 384))
+        cache = SemanticCache()
+        for i, vector in enumerate(vectors):
+            cache.put("docs", None, vector, [i])
+
+        query = vectors[123] + rng.standard_normal(384) * 0.05
+
+        assert cache.get("docs", None, query) == [123]
+        assert cache.get("docs", None, rng.standard_normal(384)) is None
@@ -2,6 +2,7 @@ import os
 from unittest.mock import patch
 
 from mcp_server_qdrant.embeddings.types import EmbeddingProviderType
+from mcp_server_qdrant.enhanced_settings import EnhancedEmbeddingProviderSettings
 from mcp_server_qdrant.settings import (
     DEFAULT_TOOL_FIND_DESCRIPTION,
     DEFAULT_TOOL_STORE_DESCRIPTION,
@@ -105,3 +106,33 @@ class TestToolSettings:
         settings = ToolSettings()
         assert settings.tool_store_description == "Custom store description"
         assert settings.tool_find_description == "Custom find description"
+
+
+class TestEnhancedEmbeddingProviderSettings:
+    def test_list_all_fastembed_models(self):
+        """Test that every mapped model is listed once, default model first."""
+        settings = EnhancedEmbeddingProviderSettings()
+        models = settings.list_all_fastembed_models()
+        assert models[0] == settings.model_name
+        assert len(models) == len(set(models))
+        assert "BAAI/bge-large-en-v1.5" in models
+        assert "BAAI/bge-base-en" in models
+
+    @patch.dict(
+        os.environ,
+        {
+            "COLLECTION_MODEL_MAPPINGS": '{"my_notes": "e5-large"}',
+            "CUSTOM_MODEL_CONFIGS": '{"e5-large": {"dimensions": 1024, "vector_name": "e5-large", "fastembed_model": "intfloat/multilingual-e5-large"}}',
+        },
+    )
+    def test_list_all_fastembed_models_includes_overrides(self):
+        """Test that user-supplied collection mappings are included."""
+        settings = EnhancedEmbeddingProviderSettings()
+        assert "intfloat/multilingual-e5-large" in settings.list_all_fastembed_models()
+
+    def test_model_config_is_resolved_once_per_collection(self):
+        """Test that repeated lookups for a collection reuse the resolved config."""
+        settings = EnhancedEmbeddingProviderSettings()
+        config = settings.get_model_config_for_collection("legal_docs")
+        assert config.dimensions == 1024
+        assert settings.get_model_config_for_collection("legal_docs") is config
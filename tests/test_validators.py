@@ -9,7 +9,8 @@ from mcp_server_qdrant.validators import (
     is_valid_collection_name,
     validate_search_results,
     validate_metadata,
-    sanitize_query
+    sanitize_query,
+    encode_metadata,
 )
 
 
@@ -147,6 +148,16 @@ class TestMetadataValidation:
         assert not validate_metadata(123)
         assert not validate_metadata([1, 2, 3])
 
+        # The limit is in bytes, so multi-byte text counts for its encoded size
+        assert not validate_metadata({"key": "é" * 6000})
+
+        # Values that can't be serialized
+        assert not validate_metadata({"key": object()})
+
+    def test_encode_metadata_is_compact(self):
+        """Test that metadata is encoded without padding and keeps non-ASCII text."""
+        assert encode_metadata({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'
+
 
 class TestQuerySanitization:
     """Test query sanitization."""